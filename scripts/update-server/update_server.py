@@ -12,21 +12,53 @@ Or with systemd service (recommended).
 
 import os
 import sys
+import hmac
+import codecs
+import signal
 import json
-import subprocess
-import threading
-import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import asyncio
+from collections import deque
+from http import HTTPStatus
 from datetime import datetime
 
+_now = datetime.now
+
+# orjson is optional; the sidecar runs on the host's stock python3
+try:
+    import orjson
+
+    def dumps_json(data):
+        return orjson.dumps(data)
+
+except ImportError:
+
+    def dumps_json(data):
+        return json.dumps(data).encode()
+
 # Configuration
 HOST = "0.0.0.0"
 PORT = int(os.environ.get("UPDATE_SERVER_PORT", "8801"))
 RAPIDCOPY_PATH = os.environ.get("RAPIDCOPY_PATH", "/opt/RapidCopy")
 UPDATE_TOKEN = os.environ.get("UPDATE_TOKEN", "")
+UPDATE_TOKEN_BYTES = UPDATE_TOKEN.encode()
 UPDATE_SCRIPT = os.path.join(
     os.path.dirname(os.path.abspath(__file__)), "update-rapidcopy.sh"
 )
+# Seconds to wait for a client to send its request before dropping it
+REQUEST_TIMEOUT = 30
+# Upper bound on request line/header size and count
+MAX_HEADER_LINE = 8192
+MAX_HEADERS = 100
+# Largest request body read and discarded; no endpoint takes a body
+MAX_BODY_SIZE = 4096
+# Seconds the update script may run before it is killed
+UPDATE_TIMEOUT = 600
+# Number of trailing characters of update script output kept for /status
+MAX_OUTPUT_SIZE = 64 * 1024
+# Bytes read from the update script's output per read
+OUTPUT_READ_SIZE = 4096
+# Seconds to let the update script exit after SIGTERM on shutdown
+SHUTDOWN_TIMEOUT = 10
 
 # Update state
 update_state = {
@@ -36,151 +68,364 @@ update_state = {
     "completed_at": None,
     "output": "",
 }
-update_lock = threading.Lock()
-
-
-class UpdateHandler(BaseHTTPRequestHandler):
-    """HTTP request handler for update operations."""
-
-    def log_message(self, format, *args):
-        """Override to add timestamp to logs."""
-        print(f"[{datetime.now().isoformat()}] {args[0]}")
-
-    def send_json(self, status_code, data):
-        """Send JSON response."""
-        self.send_response(status_code)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Authorization, Content-Type")
-        self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
-
-    def check_auth(self):
-        """Verify the authorization token."""
-        if not UPDATE_TOKEN:
-            self.send_json(
-                500, {"error": "Server not configured: UPDATE_TOKEN not set"}
-            )
-            return False
-
-        auth_header = self.headers.get("Authorization", "")
-        if not auth_header.startswith("Bearer "):
-            self.send_json(401, {"error": "Missing or invalid Authorization header"})
-            return False
-
-        token = auth_header[7:]  # Remove "Bearer " prefix
-        if token != UPDATE_TOKEN:
-            self.send_json(403, {"error": "Invalid token"})
-            return False
-
-        return True
-
-    def do_OPTIONS(self):
-        """Handle CORS preflight requests."""
-        self.send_response(200)
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Authorization, Content-Type")
-        self.end_headers()
-
-    def do_GET(self):
-        """Handle GET requests."""
-        if self.path == "/health":
-            # Health check - no auth required
-            self.send_json(200, {"status": "ok", "service": "rapidcopy-updater"})
-            return
 
-        if self.path == "/status":
-            if not self.check_auth():
-                return
-            with update_lock:
-                self.send_json(200, update_state.copy())
-            return
 
-        self.send_json(404, {"error": "Not found"})
-
-    def do_POST(self):
-        """Handle POST requests."""
-        if self.path == "/update":
-            if not self.check_auth():
-                return
-
-            with update_lock:
-                if update_state["status"] == "updating":
-                    self.send_json(
-                        409,
-                        {
-                            "error": "Update already in progress",
-                            "started_at": update_state["started_at"],
-                        },
-                    )
-                    return
-
-                # Start update
-                update_state["status"] = "updating"
-                update_state["message"] = "Update started"
-                update_state["started_at"] = datetime.now().isoformat()
-                update_state["completed_at"] = None
-                update_state["output"] = ""
-
-            # Run update in background thread
-            thread = threading.Thread(target=run_update, daemon=True)
-            thread.start()
-
-            self.send_json(
-                202,
-                {"message": "Update started", "started_at": update_state["started_at"]},
+class OutputBuffer:
+    """Keeps the last max_size characters of a stream of text."""
+
+    TRUNCATED_MARKER = "...[truncated]...\n"
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.chunks = deque()
+        self.size = 0
+        self.truncated = False
+
+    def append(self, text):
+        self.chunks.append(text)
+        self.size += len(text)
+        while self.size > self.max_size:
+            excess = self.size - self.max_size
+            head = self.chunks[0]
+            if len(head) <= excess:
+                self.chunks.popleft()
+                self.size -= len(head)
+            else:
+                self.chunks[0] = head[excess:]
+                self.size -= excess
+            self.truncated = True
+
+    def clear(self):
+        self.chunks.clear()
+        self.size = 0
+        self.truncated = False
+
+    def getvalue(self):
+        output = "".join(self.chunks)
+        return self.TRUNCATED_MARKER + output if self.truncated else output
+
+
+# Tail of the update script output, joined into "output" on read
+update_output = OutputBuffer(MAX_OUTPUT_SIZE)
+# Created lazily so it is bound to the running event loop
+update_lock = None
+# Reference to the in-flight update task so it isn't garbage collected
+update_task = None
+# The running update script, so shutdown can stop it
+update_process = None
+
+
+def get_update_lock():
+    """Return the update state lock, creating it inside the running loop."""
+    global update_lock
+    if update_lock is None:
+        asyncio.get_running_loop()
+        update_lock = asyncio.Lock()
+    return update_lock
+
+
+class Request:
+    """Minimal parsed HTTP request."""
+
+    def __init__(self, method, path, headers):
+        self.method = method
+        self.path = path
+        self.headers = headers
+
+
+class BadRequest(Exception):
+    """Raised when the client sends a malformed HTTP request."""
+
+    pass
+
+
+class PayloadTooLarge(BadRequest):
+    """Raised when the client declares a body larger than MAX_BODY_SIZE."""
+
+    pass
+
+
+def log_message(message):
+    """Print a log line with a second-resolution timestamp."""
+    print(f"[{_now().isoformat(timespec='seconds')}] {message}")
+
+
+# Headers that are identical on every response, pre-encoded once
+CORS_HEADERS = (
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+    b"Access-Control-Allow-Headers: Authorization, Content-Type\r\n"
+    b"Connection: close\r\n"
+)
+JSON_CONTENT_TYPE = b"Content-Type: application/json\r\n"
+STATUS_LINES = {
+    status.value: f"HTTP/1.1 {status.value} {status.phrase}\r\n".encode("latin-1")
+    for status in HTTPStatus
+}
+
+
+def build_response(status_code, data=None):
+    """Serialize a full HTTP response, with an optional JSON body, to bytes."""
+    if data is None:
+        return b"".join(
+            (STATUS_LINES[status_code], CORS_HEADERS, b"Content-Length: 0\r\n\r\n")
+        )
+    body = dumps_json(data)
+    return b"".join(
+        (
+            STATUS_LINES[status_code],
+            JSON_CONTENT_TYPE,
+            CORS_HEADERS,
+            b"Content-Length: %d\r\n\r\n" % len(body),
+            body,
+        )
+    )
+
+
+def check_auth(request):
+    """
+    Verify the authorization token.
+    Returns None if authorized, otherwise the (status, data) error response.
+    """
+    if not UPDATE_TOKEN:
+        return 500, {"error": "Server not configured: UPDATE_TOKEN not set"}
+
+    auth_header = request.headers.get("authorization", "")
+    if not auth_header.startswith("Bearer "):
+        return 401, {"error": "Missing or invalid Authorization header"}
+
+    # Headers are decoded as latin-1, so this recovers the raw bytes
+    token = auth_header[7:].encode("latin-1")  # Remove "Bearer " prefix
+    if not hmac.compare_digest(token, UPDATE_TOKEN_BYTES):
+        return 403, {"error": "Invalid token"}
+
+    return None
+
+
+async def handle_options(request):
+    """Handle CORS preflight requests."""
+    return 200, None
+
+
+async def handle_health(request):
+    """Health check - no auth required."""
+    return 200, {"status": "ok", "service": "rapidcopy-updater"}
+
+
+async def handle_status(request):
+    """Return the current update state."""
+    error = check_auth(request)
+    if error:
+        return error
+    async with get_update_lock():
+        state = update_state.copy()
+    state["output"] = update_output.getvalue()
+    return 200, state
+
+
+async def handle_update(request):
+    """Start an update in the background."""
+    global update_task
+
+    error = check_auth(request)
+    if error:
+        return error
+
+    async with get_update_lock():
+        if update_state["status"] == "updating":
+            return 409, {
+                "error": "Update already in progress",
+                "started_at": update_state["started_at"],
+            }
+
+        # Start update
+        started_at = _now().isoformat()
+        update_state["status"] = "updating"
+        update_state["message"] = "Update started"
+        update_state["started_at"] = started_at
+        update_state["completed_at"] = None
+        update_output.clear()
+
+    # Run update in the background on the event loop
+    update_task = asyncio.get_running_loop().create_task(run_update())
+
+    return 202, {"message": "Update started", "started_at": started_at}
+
+
+ROUTES = {
+    ("GET", "/health"): handle_health,
+    ("GET", "/status"): handle_status,
+    ("POST", "/update"): handle_update,
+}
+
+
+async def read_request(reader):
+    """Parse the request line, headers and (discarded) body from the stream."""
+    request_line = await reader.readline()
+    if not request_line:
+        return None, None
+    if len(request_line) > MAX_HEADER_LINE:
+        raise BadRequest("Request line too long")
+    request_line = request_line.decode("latin-1").rstrip("\r\n")
+    parts = request_line.split()
+    if len(parts) != 3:
+        raise BadRequest(f"Malformed request line: {request_line!r}")
+    method, path, _ = parts
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        if len(line) > MAX_HEADER_LINE or len(headers) >= MAX_HEADERS:
+            raise BadRequest("Request headers too large")
+        name, sep, value = line.decode("latin-1").partition(":")
+        if not sep:
+            raise BadRequest(f"Malformed header: {line!r}")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        content_length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise BadRequest("Invalid Content-Length")
+    if content_length > MAX_BODY_SIZE:
+        # Checked before auth, so don't let a client make us buffer it
+        raise PayloadTooLarge(f"Content-Length {content_length} too large")
+    if content_length > 0:
+        # No endpoint takes a body; read it so the client isn't reset
+        await reader.readexactly(content_length)
+
+    return request_line, Request(method, path, headers)
+
+
+async def handle_connection(reader, writer):
+    """Serve a single request on a client connection, then close it."""
+    try:
+        try:
+            request_line, request = await asyncio.wait_for(
+                read_request(reader), timeout=REQUEST_TIMEOUT
             )
+        except (BadRequest, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError) as e:
+            # readline() raises ValueError for a line longer than the stream's limit
+            log_message(f"Bad request: {e}")
+            if isinstance(e, PayloadTooLarge):
+                writer.write(build_response(413, {"error": "Request body too large"}))
+            else:
+                writer.write(build_response(400, {"error": "Bad request"}))
+            await writer.drain()
+            return
+        if request is None:
             return
 
-        self.send_json(404, {"error": "Not found"})
+        log_message(request_line)
+        if request.method == "OPTIONS":
+            handler = handle_options
+        else:
+            handler = ROUTES.get((request.method, request.path))
+        if handler is None:
+            status_code, data = 404, {"error": "Not found"}
+        else:
+            status_code, data = await handler(request)
+
+        writer.write(build_response(status_code, data))
+        await writer.drain()
+    except (asyncio.TimeoutError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def read_output(stream):
+    """Append the update script's output as it arrives."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        data = await stream.read(OUTPUT_READ_SIZE)
+        if not data:
+            break
+        update_output.append(decoder.decode(data))
+    update_output.append(decoder.decode(b"", final=True))
+
+
+def kill_process_group(proc, sig=signal.SIGKILL):
+    """Signal the update script and everything it spawned."""
+    try:
+        os.killpg(proc.pid, sig)
+    except ProcessLookupError:
+        pass
+
+
+async def terminate_update():
+    """Stop an in-progress update so the script isn't orphaned on shutdown."""
+    proc = update_process
+    if proc is None or proc.returncode is not None:
+        return
+    log_message("Terminating in-progress update")
+    kill_process_group(proc, signal.SIGTERM)
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=SHUTDOWN_TIMEOUT)
+    except asyncio.TimeoutError:
+        kill_process_group(proc)
+        await proc.wait()
 
 
-def run_update():
+async def run_update():
     """Run the update script in background."""
-    global update_state
+    global update_process
 
     try:
-        print(f"[{datetime.now().isoformat()}] Starting update...")
+        log_message("Starting update...")
 
-        # Run the update script
-        result = subprocess.run(
-            [UPDATE_SCRIPT],
+        # Run the update script, streaming stdout and stderr together
+        proc = await asyncio.create_subprocess_exec(
+            UPDATE_SCRIPT,
             cwd=RAPIDCOPY_PATH,
-            capture_output=True,
-            text=True,
-            timeout=600,  # 10 minute timeout
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            # Own process group so children of the script can be killed too
+            start_new_session=True,
         )
+        update_process = proc
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(read_output(proc.stdout), proc.wait()),
+                timeout=UPDATE_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            kill_process_group(proc)
+            await proc.wait()
+            async with get_update_lock():
+                update_state["status"] = "failed"
+                update_state["message"] = "Update timed out after 10 minutes"
+                update_state["completed_at"] = _now().isoformat()
+            log_message("Update timed out")
+            return
 
-        with update_lock:
-            update_state["output"] = result.stdout + result.stderr
-            update_state["completed_at"] = datetime.now().isoformat()
+        async with get_update_lock():
+            update_state["completed_at"] = _now().isoformat()
 
-            if result.returncode == 0:
+            if proc.returncode == 0:
                 update_state["status"] = "success"
                 update_state["message"] = "Update completed successfully"
-                print(f"[{datetime.now().isoformat()}] Update completed successfully")
+                log_message("Update completed successfully")
             else:
                 update_state["status"] = "failed"
                 update_state["message"] = (
-                    f"Update failed with exit code {result.returncode}"
+                    f"Update failed with exit code {proc.returncode}"
+                )
+                log_message(
+                    f"Update failed with exit code {proc.returncode}: "
+                    f"{update_output.getvalue()}"
                 )
-                print(f"[{datetime.now().isoformat()}] Update failed: {result.stderr}")
-
-    except subprocess.TimeoutExpired:
-        with update_lock:
-            update_state["status"] = "failed"
-            update_state["message"] = "Update timed out after 10 minutes"
-            update_state["completed_at"] = datetime.now().isoformat()
-        print(f"[{datetime.now().isoformat()}] Update timed out")
 
     except Exception as e:
-        with update_lock:
+        async with get_update_lock():
             update_state["status"] = "failed"
             update_state["message"] = f"Update error: {str(e)}"
-            update_state["completed_at"] = datetime.now().isoformat()
-        print(f"[{datetime.now().isoformat()}] Update error: {e}")
+            update_state["completed_at"] = _now().isoformat()
+        log_message(f"Update error: {e}")
+
+    finally:
+        update_process = None
 
 
 def main():
@@ -204,14 +449,25 @@ def main():
     print(f"  Update script: {UPDATE_SCRIPT}")
     print(f"  Token configured: {'Yes' if UPDATE_TOKEN else 'No'}")
 
-    server = HTTPServer((HOST, PORT), UpdateHandler)
-    print(f"Server listening on {HOST}:{PORT}")
-
     try:
-        server.serve_forever()
+        asyncio.run(serve())
     except KeyboardInterrupt:
         print("\nShutting down...")
-        server.shutdown()
+
+
+async def serve():
+    """Accept connections on the event loop until SIGTERM or SIGINT."""
+    shutdown_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, shutdown_event.set)
+
+    server = await asyncio.start_server(handle_connection, HOST, PORT)
+    print(f"Server listening on {HOST}:{PORT}")
+    async with server:
+        await shutdown_event.wait()
+        print("\nShutting down...")
+    await terminate_update()
 
 
 if __name__ == "__main__":
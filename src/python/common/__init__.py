@@ -11,3 +11,6 @@ from .localization import Localization
 from .multiprocessing_logger import MultiprocessingLogger
 from .status import Status, IStatusListener, StatusComponent, IStatusComponentListener
 from .app_process import AppProcess, AppOneShotProcess
+from .validation_models import (
+    ChunkStatus, ValidationAlgorithm, ChunkInfo, FileValidationInfo, NetworkStats, ValidationConfig
+)
@@ -1,13 +1,13 @@
 # Copyright 2017, Inderpreet Singh, All rights reserved.
 
-import configparser
+import functools
 import json
-from typing import Dict, List
-from io import StringIO
-import collections
-from distutils.util import strtobool
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+import sys
 from abc import ABC
-from typing import Type, TypeVar, Callable, Any
+from typing import Type, TypeVar, Callable, Any, Tuple
 
 from .error import AppError
 from .persist import Persist, PersistError
@@ -21,13 +21,15 @@ class ConfigError(AppError):
     pass
 
 
+@dataclass(frozen=True)
 class PathMapping:
     """
     Represents a single remote/local directory path mapping
     """
-    def __init__(self, remote_path: str, local_path: str):
-        self.remote_path = remote_path
-        self.local_path = local_path
+    __slots__ = ("remote_path", "local_path")
+
+    remote_path: str
+    local_path: str
 
     def to_dict(self) -> dict:
         return {"remote_path": self.remote_path, "local_path": self.local_path}
@@ -36,13 +38,29 @@ class PathMapping:
     def from_dict(d: dict) -> "PathMapping":
         return PathMapping(d["remote_path"], d["local_path"])
 
-    def __eq__(self, other):
-        if not isinstance(other, PathMapping):
-            return False
-        return self.remote_path == other.remote_path and self.local_path == other.local_path
-
     def __repr__(self):
-        return "PathMapping(remote_path={}, local_path={})".format(self.remote_path, self.local_path)
+        return f"PathMapping(remote_path={self.remote_path}, local_path={self.local_path})"
+
+
+# Same accepted values as the former distutils.util.strtobool
+_BOOL_MAP = {
+    "y": True, "yes": True, "t": True, "true": True, "on": True, "1": True,
+    "n": False, "no": False, "f": False, "false": False, "off": False, "0": False,
+}
+
+
+def strtobool(val: str) -> bool:
+    """
+    Convert a string representation of truth to True or False
+    Raises ValueError if val is anything else
+    """
+    # Skip the lower() allocation for values that are already lowercase
+    result = _BOOL_MAP.get(val)
+    if result is None:
+        result = _BOOL_MAP.get(val.lower())
+        if result is None:
+            raise ValueError(f"invalid truth value {val!r}")
+    return result
 
 
 InnerConfigType = Dict[str, str]
@@ -61,29 +79,21 @@ class Converters:
     @staticmethod
     def int(cls: T, name: str, value: str) -> int:
         if not value:
-            raise ConfigError("Bad config: {}.{} is empty".format(
-                cls.__name__, name
-            ))
+            raise ConfigError(f"Bad config: {cls.__name__}.{name} is empty")
         try:
             val = int(value)
         except ValueError:
-            raise ConfigError("Bad config: {}.{} ({}) must be an integer value".format(
-                cls.__name__, name, value
-            ))
+            raise ConfigError(f"Bad config: {cls.__name__}.{name} ({value}) must be an integer value")
         return val
 
     @staticmethod
     def bool(cls: T, name: str, value: str) -> bool:
         if not value:
-            raise ConfigError("Bad config: {}.{} is empty".format(
-                cls.__name__, name
-            ))
+            raise ConfigError(f"Bad config: {cls.__name__}.{name} is empty")
         try:
-            val = bool(strtobool(value))
+            val = strtobool(value)
         except ValueError:
-            raise ConfigError("Bad config: {}.{} ({}) must be a boolean value".format(
-                cls.__name__, name, value
-            ))
+            raise ConfigError(f"Bad config: {cls.__name__}.{name} ({value}) must be a boolean value")
         return val
 
 
@@ -95,28 +105,53 @@ class Checkers:
     @staticmethod
     def string_nonempty(cls: T, name: str, value: str) -> str:
         if not value or not value.strip():
-            raise ConfigError("Bad config: {}.{} is empty".format(
-                cls.__name__, name
-            ))
+            raise ConfigError(f"Bad config: {cls.__name__}.{name} is empty")
         return value
 
     @staticmethod
     def int_non_negative(cls: T, name: str, value: int) -> int:
         if value < 0:
-            raise ConfigError("Bad config: {}.{} ({}) must be zero or greater".format(
-                cls.__name__, name, value
-            ))
+            raise ConfigError(f"Bad config: {cls.__name__}.{name} ({value}) must be zero or greater")
         return value
 
     @staticmethod
     def int_positive(cls: T, name: str, value: int) -> int:
         if value < 1:
-            raise ConfigError("Bad config: {}.{} ({}) must be greater than 0".format(
-                cls.__name__, name, value
-            ))
+            raise ConfigError(f"Bad config: {cls.__name__}.{name} ({value}) must be greater than 0")
         return value
 
 
+class _ConfigProperty(property):
+    """A config property that carries its metadata"""
+    def __init__(self, fget: Callable, fset: Callable, metadata: "InnerConfig.PropMetadata"):
+        super().__init__(fget=fget, fset=fset)
+        self.metadata = metadata
+
+
+def _make_setter(cls: type, attr_name: str, prop: _ConfigProperty) -> Callable[[Any, Any], None]:
+    """
+    Build the set_property implementation for one property of a config class
+    Converts str values to the native type, then stores through the property
+    :param cls:
+    :param attr_name:
+    :param prop:
+    :return:
+    """
+    converter = prop.metadata.converter
+    store = prop.fset
+    if converter is Converters.null:
+        # str values are already the native type
+        return store
+
+    def setter(inner_config: Any, value: Any):
+        # Do the conversion if value is of type str
+        if type(value) is str:
+            value = converter(cls, attr_name, value)
+        store(inner_config, value)
+
+    return setter
+
+
 class InnerConfig(ABC):
     """
     Abstract base class for a config section
@@ -131,32 +166,63 @@ class InnerConfig(ABC):
     """
     class PropMetadata:
         """Tracks property metadata"""
-        def __init__(self, checker: Callable, converter: Callable):
+        def __init__(self, name: str, checker: Callable, converter: Callable):
+            self.name = name
             self.checker = checker
             self.converter = converter
 
-    # Global map to map a property to its metadata
-    # Is there a way for each concrete class to do this separately?
-    __prop_addon_map = collections.OrderedDict()
+    # Maps attribute name to property metadata, in order of property creation
+    # Populated for each concrete class by __init_subclass__
+    _prop_meta: Dict[str, "InnerConfig.PropMetadata"] = {}
+    # Maps attribute name to its specialized set_property implementation
+    _prop_setters: Dict[str, Callable[[Any, Any], None]] = {}
+
+    # Result of the last as_dict(), cleared whenever a property is set
+    _dict_cache = None
 
     @classmethod
     def _create_property(cls, name: str, checker: Callable, converter: Callable) -> property:
-        # noinspection PyProtectedMember
-        prop = property(fget=lambda s: s._get_property(name),
-                        fset=lambda s, v: s._set_property(name, v, checker))
-        prop_addon = InnerConfig.PropMetadata(checker=checker, converter=converter)
-        InnerConfig.__prop_addon_map[prop] = prop_addon
-        return prop
-
-    def _get_property(self, name: str) -> Any:
-        return getattr(self, "__" + name, None)
-
-    def _set_property(self, name: str, value: Any, checker: Callable):
-        # Allow setting to None for the first time
-        if value is None and self._get_property(name) is None:
-            setattr(self, "__" + name, None)
+        # Values are stored in the instance __dict__ under this key
+        name = sys.intern(name)
+
+        def fget(inner_config: Any) -> Any:
+            # Never-set properties read as None, so sections need no __init__
+            return inner_config.__dict__.get(name, None)
+
+        if checker is Checkers.null:
+            # Nothing to check, any value (None included) is stored as is
+            def fset(inner_config: Any, value: Any):
+                values = inner_config.__dict__
+                values["_dict_cache"] = None
+                values[name] = value
         else:
-            setattr(self, "__" + name, checker(self.__class__, name, value))
+            def fset(inner_config: Any, value: Any):
+                values = inner_config.__dict__
+                values["_dict_cache"] = None
+                # Allow setting to None for the first time
+                if value is None and values.get(name, None) is None:
+                    values[name] = None
+                else:
+                    values[name] = checker(type(inner_config), name, value)
+
+        return _ConfigProperty(
+            fget=fget,
+            fset=fset,
+            metadata=InnerConfig.PropMetadata(name=name, checker=checker, converter=converter)
+        )
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Class body order is property creation order
+        prop_meta = dict(cls._prop_meta)
+        for attr_name, attr in vars(cls).items():
+            if isinstance(attr, _ConfigProperty):
+                prop_meta[attr_name] = attr.metadata
+        cls._prop_meta = prop_meta
+        cls._prop_setters = {
+            attr_name: _make_setter(cls, attr_name, getattr(cls, attr_name))
+            for attr_name in prop_meta
+        }
 
     @classmethod
     def from_dict(cls: Type[T], config_dict: InnerConfigType) -> T:
@@ -166,23 +232,24 @@ class InnerConfig(ABC):
         :param config_dict:
         :return:
         """
-        config_dict = dict(config_dict)  # copy that we can modify
+        prop_meta = cls._prop_meta
 
-        # Loop over all the property name, and set them to the value given in config_dict
-        # Raise error if a matching key is not found in config_dict
-        # noinspection PyCallingNonCallable
-        inner_config = cls()
-        property_map = {p: getattr(cls, p) for p in dir(cls) if isinstance(getattr(cls, p), property)}
-        for name, prop in property_map.items():
-            if name not in config_dict:
-                raise ConfigError("Missing config: {}.{}".format(cls.__name__, name))
-            inner_config.set_property(name, config_dict[name])
-            del config_dict[name]
+        # Raise error if a property has no matching key in config_dict
+        missing_keys = prop_meta.keys() - config_dict.keys()
+        if missing_keys:
+            name = next(n for n in prop_meta if n in missing_keys)
+            raise ConfigError(f"Missing config: {cls.__name__}.{name}")
 
+        # Set each property to the value given in config_dict
         # Raise error if a key in config_dict did not match a property
-        extra_keys = config_dict.keys()
-        if extra_keys:
-            raise ConfigError("Unknown config: {}.{}".format(cls.__name__, next(iter(extra_keys))))
+        # noinspection PyCallingNonCallable
+        inner_config = cls()
+        prop_setters = cls._prop_setters
+        for name, value in config_dict.items():
+            setter = prop_setters.get(name)
+            if setter is None:
+                raise ConfigError(f"Unknown config: {cls.__name__}.{name}")
+            setter(inner_config, value)
 
         return inner_config
 
@@ -191,17 +258,13 @@ class InnerConfig(ABC):
         Return the dict representation of the inner config
         :return:
         """
-        config_dict = collections.OrderedDict()
-        cls = self.__class__
-        my_property_to_name_map = {getattr(cls, p): p for p in dir(cls) if isinstance(getattr(cls, p), property)}
-        # Arrange prop names in order of creation. Use the prop map to get the order
-        # Prop map contains all properties of all config classes, so filtering is required
-        all_properties = InnerConfig.__prop_addon_map.keys()
-        for prop in all_properties:
-            if prop in my_property_to_name_map.keys():
-                name = my_property_to_name_map[prop]
+        if self._dict_cache is None:
+            config_dict = {}
+            for name in self._prop_meta:
                 config_dict[name] = getattr(self, name)
-        return config_dict
+            self._dict_cache = config_dict
+        # Hand out a copy so callers can't modify the cache
+        return dict(self._dict_cache)
 
     def has_property(self, name: str) -> bool:
         """
@@ -209,10 +272,7 @@ class InnerConfig(ABC):
         :param name:
         :return:
         """
-        try:
-            return isinstance(getattr(self.__class__, name), property)
-        except AttributeError:
-            return False
+        return name in self._prop_meta
 
     def set_property(self, name: str, value: Any):
         """
@@ -222,13 +282,7 @@ class InnerConfig(ABC):
         :param value:
         :return:
         """
-        cls = self.__class__
-        prop_addon = InnerConfig.__prop_addon_map[getattr(cls, name)]
-        # Do the conversion if value is of type str
-        native_value = prop_addon.converter(cls, name, value) if type(value) is str else value
-        # Set the property, which will invoke the checker
-        # noinspection PyProtectedMember
-        self._set_property(name, native_value, prop_addon.checker)
+        self._prop_setters[name](self, value)
 
 
 # Useful aliases
@@ -237,6 +291,67 @@ IC = InnerConfig
 PROP = InnerConfig._create_property
 
 
+ParsedConfigType = Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...]
+
+_INI_SECTION = re.compile(r"\[(?P<header>.+)\]")
+_INI_OPTION = re.compile(r"(?P<option>.*?)\s*[=:]\s*(?P<value>.*)$")
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_str(content: str) -> ParsedConfigType:
+    """
+    Parse INI content into ((section, ((option, value), ...)), ...)
+    Results are immutable so they can be cached; re-reading unchanged
+    content skips parsing entirely
+    :param content:
+    :return:
+    """
+    # Minimal reader for the format written by Config.to_str()
+    # Follows configparser's rules for comments, delimiters, option case and
+    # indented continuation lines, but has no interpolation or DEFAULT section
+    sections: Dict[str, Dict[str, List[str]]] = {}
+    options: Optional[Dict[str, List[str]]] = None
+    value_lines: Optional[List[str]] = None
+    value_indent = 0
+    for lineno, line in enumerate(content.splitlines(), start=1):
+        stripped = line.strip()
+        if stripped and stripped[0] in "#;":
+            continue
+        if not stripped:
+            # Blank lines belong to the value if a continuation line follows
+            if value_lines is not None:
+                value_lines.append("")
+            continue
+        indent = len(line) - len(line.lstrip())
+        if value_lines is not None and indent > value_indent:
+            value_lines.append(stripped)
+            continue
+        value_lines = None
+        section_match = _INI_SECTION.match(stripped)
+        if section_match:
+            # Names come from a small fixed set, so share one string object per
+            # name across every parse and make dict lookups identity hits
+            section = sys.intern(section_match.group("header"))
+            if section in sections:
+                raise PersistError(f"Error parsing Config - line {lineno}: duplicate section {section!r}")
+            options = sections[section] = {}
+            continue
+        if options is None:
+            raise PersistError(f"Error parsing Config - line {lineno}: missing section header: {stripped!r}")
+        option_match = _INI_OPTION.match(stripped)
+        if not option_match or not option_match.group("option"):
+            raise PersistError(f"Error parsing Config - line {lineno}: {stripped!r}")
+        option = sys.intern(option_match.group("option").lower())
+        if option in options:
+            raise PersistError(f"Error parsing Config - line {lineno}: duplicate option {option!r}")
+        value_lines = options[option] = [option_match.group("value")]
+        value_indent = indent
+    return tuple(
+        (section, tuple((option, "\n".join(lines).rstrip()) for option, lines in opts.items()))
+        for section, opts in sections.items()
+    )
+
+
 class Config(Persist):
     """
     Configuration registry
@@ -245,11 +360,6 @@ class Config(Persist):
         debug = PROP("debug", Checkers.null, Converters.bool)
         verbose = PROP("verbose", Checkers.null, Converters.bool)
 
-        def __init__(self):
-            super().__init__()
-            self.debug = None
-            self.verbose = None
-
     class Lftp(IC):
         remote_address = PROP("remote_address", Checkers.string_nonempty, Converters.null)
         remote_username = PROP("remote_username", Checkers.string_nonempty, Converters.null)
@@ -272,23 +382,6 @@ class Config(Persist):
         num_max_total_connections = PROP("num_max_total_connections", Checkers.int_non_negative, Converters.int)
         use_temp_file = PROP("use_temp_file", Checkers.null, Converters.bool)
 
-        def __init__(self):
-            super().__init__()
-            self.remote_address = None
-            self.remote_username = None
-            self.remote_password = None
-            self.remote_port = None
-            self.remote_path = None
-            self.local_path = None
-            self.remote_path_to_scan_script = None
-            self.use_ssh_key = None
-            self.num_max_parallel_downloads = None
-            self.num_max_parallel_files_per_download = None
-            self.num_max_connections_per_root_file = None
-            self.num_max_connections_per_dir_file = None
-            self.num_max_total_connections = None
-            self.use_temp_file = None
-
     class Controller(IC):
         interval_ms_remote_scan = PROP("interval_ms_remote_scan", Checkers.int_positive, Converters.int)
         interval_ms_local_scan = PROP("interval_ms_local_scan", Checkers.int_positive, Converters.int)
@@ -302,44 +395,27 @@ class Config(Persist):
         enable_disk_space_check = PROP("enable_disk_space_check", Checkers.null, Converters.bool)
         disk_space_min_percent = PROP("disk_space_min_percent", Checkers.int_positive, Converters.int)
 
-        def __init__(self):
-            super().__init__()
-            self.interval_ms_remote_scan = None
-            self.interval_ms_local_scan = None
-            self.interval_ms_downloading_scan = None
-            self.extract_path = None
-            self.use_local_path_as_extract_path = None
-            self.enable_download_validation = None
-            self.download_validation_max_retries = None
-            self.use_chunked_validation = None
-            self.validation_chunk_size_mb = None
-            self.enable_disk_space_check = None
-            self.disk_space_min_percent = None
-
     class Web(InnerConfig):
         port = PROP("port", Checkers.int_positive, Converters.int)
 
-        def __init__(self):
-            super().__init__()
-            self.port = None
-
     class AutoQueue(InnerConfig):
         enabled = PROP("enabled", Checkers.null, Converters.bool)
         patterns_only = PROP("patterns_only", Checkers.null, Converters.bool)
         auto_extract = PROP("auto_extract", Checkers.null, Converters.bool)
 
-        def __init__(self):
-            super().__init__()
-            self.enabled = None
-            self.patterns_only = None
-            self.auto_extract = None
-
     class PathMappings(IC):
         mappings_json = PROP("mappings_json", Checkers.null, Converters.null)
 
-        def __init__(self):
-            super().__init__()
-            self.mappings_json = None
+        # Last parsed mappings_json and its result, see Config.get_path_mappings()
+        _cached_json = None
+        _cached_list: List[PathMapping] = []
+
+    # Sections that must be present in from_dict() input, in file order
+    _REQUIRED_SECTIONS = ("General", "Lftp", "Controller", "Web", "AutoQueue")
+    # PathMappings is optional for backward compatibility
+    _KNOWN_SECTIONS = frozenset(_REQUIRED_SECTIONS + ("PathMappings",))
+    # Attribute names of the section instances, see has_section()
+    _SECTION_ATTRS = frozenset(("general", "lftp", "controller", "web", "autoqueue", "pathmappings"))
 
     def __init__(self):
         self.general = Config.General()
@@ -349,82 +425,59 @@ class Config(Persist):
         self.autoqueue = Config.AutoQueue()
         self.pathmappings = Config.PathMappings()
 
-    @staticmethod
-    def _check_section(dct: OuterConfigType, name: str) -> InnerConfigType:
-        if name not in dct:
-            raise ConfigError("Missing config section: {}".format(name))
-        val = dct[name]
-        del dct[name]
-        return val
-
-    @staticmethod
-    def _check_empty_outer_dict(dct: OuterConfigType):
-        extra_keys = dct.keys()
-        if extra_keys:
-            raise ConfigError("Unknown section: {}".format(next(iter(extra_keys))))
-
     @classmethod
     @overrides(Persist)
     def from_str(cls: "Config", content: str) -> "Config":
-        config_parser = configparser.ConfigParser()
-        try:
-            config_parser.read_string(content)
-        except (
-                configparser.MissingSectionHeaderError,
-                configparser.ParsingError
-        ) as e:
-            raise PersistError("Error parsing Config - {}: {}".format(
-                type(e).__name__, str(e))
-            )
-        config_dict = {}
-        for section in config_parser.sections():
-            config_dict[section] = {}
-            for option in config_parser.options(section):
-                config_dict[section][option] = config_parser.get(section, option)
+        """
+        Parse config from INI content
+        :param content:
+        :return:
+        """
+        config_dict = {section: dict(options) for section, options in _parse_config_str(content)}
         return Config.from_dict(config_dict)
 
     @overrides(Persist)
     def to_str(self) -> str:
-        config_parser = configparser.ConfigParser()
-        config_dict = self.as_dict()
-        for section in config_dict:
-            config_parser.add_section(section)
-            section_dict = config_dict[section]
-            for key in section_dict:
-                config_parser.set(section, key, str(section_dict[key]))
-        str_io = StringIO()
-        config_parser.write(str_io)
-        return str_io.getvalue()
+        # Same layout as ConfigParser.write(), without building a parser
+        parts = []
+        for section, section_dict in self.as_dict().items():
+            parts.append(f"[{section}]\n")
+            for key, value in section_dict.items():
+                value = str(value).replace("\n", "\n\t")
+                parts.append(f"{key} = {value}\n")
+            parts.append("\n")
+        return "".join(parts)
 
     @staticmethod
     def from_dict(config_dict: OuterConfigType) -> "Config":
-        config_dict = dict(config_dict)  # copy that we can modify
-        config = Config()
+        sections = config_dict.keys()
+        for name in Config._REQUIRED_SECTIONS:
+            if name not in sections:
+                raise ConfigError(f"Missing config section: {name}")
+        unknown_sections = sections - Config._KNOWN_SECTIONS
+        if unknown_sections:
+            raise ConfigError(f"Unknown section: {next(k for k in config_dict if k in unknown_sections)}")
 
-        config.general = Config.General.from_dict(Config._check_section(config_dict, "General"))
-        config.lftp = Config.Lftp.from_dict(Config._check_section(config_dict, "Lftp"))
-        config.controller = Config.Controller.from_dict(Config._check_section(config_dict, "Controller"))
-        config.web = Config.Web.from_dict(Config._check_section(config_dict, "Web"))
-        config.autoqueue = Config.AutoQueue.from_dict(Config._check_section(config_dict, "AutoQueue"))
+        config = Config()
+        config.general = Config.General.from_dict(config_dict["General"])
+        config.lftp = Config.Lftp.from_dict(config_dict["Lftp"])
+        config.controller = Config.Controller.from_dict(config_dict["Controller"])
+        config.web = Config.Web.from_dict(config_dict["Web"])
+        config.autoqueue = Config.AutoQueue.from_dict(config_dict["AutoQueue"])
 
-        # PathMappings is optional for backward compatibility
         if "PathMappings" in config_dict:
-            config.pathmappings = Config.PathMappings.from_dict(
-                Config._check_section(config_dict, "PathMappings")
-            )
+            config.pathmappings = Config.PathMappings.from_dict(config_dict["PathMappings"])
         else:
             # Migrate from lftp.remote_path and lftp.local_path
             config.pathmappings = Config.PathMappings()
-            mappings = [PathMapping(config.lftp.remote_path, config.lftp.local_path)]
-            config.pathmappings.mappings_json = json.dumps([m.to_dict() for m in mappings])
+            config.set_path_mappings([PathMapping(config.lftp.remote_path, config.lftp.local_path)])
 
-        Config._check_empty_outer_dict(config_dict)
         return config
 
     def as_dict(self) -> OuterConfigType:
         # We convert all values back to strings
-        # Use an ordered dict to main section order
-        config_dict = collections.OrderedDict()
+        # Dicts keep insertion order, which maintains section order
+        config_dict = {}
         config_dict["General"] = self.general.as_dict()
         config_dict["Lftp"] = self.lftp.as_dict()
         config_dict["Controller"] = self.controller.as_dict()
@@ -437,16 +490,23 @@ class Config(Persist):
         """
         Returns the list of path mappings from the config
         """
-        if self.pathmappings.mappings_json:
-            data = json.loads(self.pathmappings.mappings_json)
-            return [PathMapping.from_dict(d) for d in data]
-        return []
+        pathmappings = self.pathmappings
+        mappings_json = pathmappings.mappings_json
+        if not mappings_json:
+            return []
+        # Same string object means same content, so the last parse still holds
+        if pathmappings._cached_json is not mappings_json:
+            data = json.loads(mappings_json)
+            pathmappings._cached_list = [PathMapping.from_dict(d) for d in data]
+            pathmappings._cached_json = mappings_json
+        return list(pathmappings._cached_list)
 
     def set_path_mappings(self, mappings: List[PathMapping]):
         """
         Sets the path mappings in the config
         """
-        self.pathmappings.mappings_json = json.dumps([m.to_dict() for m in mappings])
+        self.pathmappings._cached_json = None
+        self.pathmappings.mappings_json = json.dumps([m.to_dict() for m in mappings], separators=(",", ":"))
 
     def has_section(self, name: str) -> bool:
         """
@@ -454,7 +514,4 @@ class Config(Persist):
         :param name:
         :return:
         """
-        try:
-            return isinstance(getattr(self, name), InnerConfig)
-        except AttributeError:
-            return False
+        return name in Config._SECTION_ATTRS
@@ -1,12 +1,13 @@
 # Copyright 2017, Inderpreet Singh, All rights reserved.
 
 import logging
-import copy
-import collections
+from typing import Optional
 
 # my libs
 from .config import Config
 from .status import Status
+from .path_pair import PathPairManager
+from .network_mount import NetworkMountManager
 
 
 class Args:
@@ -15,14 +16,25 @@ class Args:
     These are settings that aren't part of config but still needed by
     sub-components
     """
+    __slots__ = (
+        "local_path_to_scanfs",
+        "html_path",
+        "debug",
+        "exit",
+        "log_dir",
+        "config_path",
+    )
+
     def __init__(self):
         self.local_path_to_scanfs = None
         self.html_path = None
         self.debug = None
         self.exit = None
+        self.log_dir = None
+        self.config_path = None
 
     def as_dict(self) -> dict:
-        dct = collections.OrderedDict()
+        dct = {}
         dct["local_path_to_scanfs"] = str(self.local_path_to_scanfs)
         dct["html_path"] = str(self.html_path)
         dct["debug"] = str(self.debug)
@@ -34,12 +46,24 @@ class Context:
     """
     Stores contextual information for the entire application
     """
+    __slots__ = (
+        "logger",
+        "web_access_logger",
+        "config",
+        "args",
+        "status",
+        "path_pair_manager",
+        "network_mount_manager",
+    )
+
     def __init__(self,
                  logger: logging.Logger,
                  web_access_logger: logging.Logger,
                  config: Config,
                  args: Args,
-                 status: Status):
+                 status: Status,
+                 path_pair_manager: Optional[PathPairManager] = None,
+                 network_mount_manager: Optional[NetworkMountManager] = None):
         """
         Primary constructor to construct the top-level context
         """
@@ -49,21 +73,32 @@ class Context:
         self.config = config
         self.args = args
         self.status = status
+        self.path_pair_manager = path_pair_manager
+        self.network_mount_manager = network_mount_manager
 
     def create_child_context(self, context_name: str) -> "Context":
-        child_context = copy.copy(self)
-        child_context.logger = self.logger.getChild(context_name)
-        return child_context
+        # Children share everything except the logger
+        return Context(
+            logger=self.logger.getChild(context_name),
+            web_access_logger=self.web_access_logger,
+            config=self.config,
+            args=self.args,
+            status=self.status,
+            path_pair_manager=self.path_pair_manager,
+            network_mount_manager=self.network_mount_manager,
+        )
 
     def print_to_log(self):
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+
         # Print the config
         self.logger.debug("Config:")
         config_dict = self.config.as_dict()
-        for section in config_dict.keys():
-            for option in config_dict[section].keys():
-                value = config_dict[section][option]
-                self.logger.debug("  {}.{}: {}".format(section, option, value))
+        for section, section_dict in config_dict.items():
+            for option, value in section_dict.items():
+                self.logger.debug("  %s.%s: %s", section, option, value)
 
         self.logger.debug("Args:")
         for name, value in self.args.as_dict().items():
-            self.logger.debug("  {}: {}".format(name, value))
+            self.logger.debug("  %s: %s", name, value)
@@ -12,15 +12,26 @@ This module provides:
 - Utility functions for creating child loggers
 """
 
+import copy
 import logging
+import os
+import queue
 import sys
+import threading
 import json
-from datetime import datetime
+import time
+from json.encoder import encode_basestring
 from logging.handlers import RotatingFileHandler
 from typing import Any
 
 from .constants import Constants
 
+# orjson is optional; fall back to the stdlib encoder when it's not installed
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 class LogLevel:
     """Valid log level names and their mapping to logging constants."""
@@ -67,11 +78,58 @@ class JsonFormatter(logging.Formatter):
     JSON formatter for structured logging.
 
     Produces JSON output suitable for log aggregation tools like ELK, Splunk, etc.
+    Uses orjson when available and falls back to json.dumps for anything
+    orjson can't encode, such as ints wider than 64 bits.
     """
 
+    # Datetimes in extra data go through default=str, as with json.dumps
+    _ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+    # Without orjson, records with no exception or extra data are written
+    # through this template, which is much cheaper than json.dumps on a
+    # nested dict. Same layout as the dict path below.
+    _TEMPLATE = (
+        '{"timestamp":"%s","level":%s,"logger":%s,"message":%s,'
+        '"process":{"name":%s,"id":%s},'
+        '"thread":{"name":%s,"id":%s},'
+        '"source":{"file":%s,"line":%d,"function":%s}}'
+    )
+
+    # (second, formatted second) of the last timestamp, swapped as one tuple
+    # so concurrent formatters never see a mismatched pair
+    _ts_cache: tuple[int, str] = (-1, "")
+
+    @classmethod
+    def _timestamp(cls, created: float) -> str:
+        """
+        ISO 8601 UTC timestamp for a record creation time.
+        The date/time part only changes once a second, so it is cached.
+        """
+        sec = int(created)
+        cached_sec, cached_str = cls._ts_cache
+        if sec != cached_sec:
+            cached_str = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            cls._ts_cache = (sec, cached_str)
+        return f"{cached_str}.{int((created - sec) * 1e6):06d}Z"
+
     def format(self, record: logging.LogRecord) -> str:
+        if orjson is None and not record.exc_info and not hasattr(record, "extra_data"):
+            return self._TEMPLATE % (
+                self._timestamp(record.created),
+                _json_str(record.levelname),
+                _json_str(record.name),
+                _json_str(record.getMessage()),
+                _json_str(record.processName),
+                _json_int(record.process),
+                _json_str(record.threadName),
+                _json_int(record.thread),
+                _json_str(record.filename),
+                record.lineno,
+                _json_str(record.funcName),
+            )
+
         log_data: dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -98,7 +156,217 @@ class JsonFormatter(logging.Formatter):
         if hasattr(record, "extra_data"):
             log_data["extra"] = record.extra_data
 
-        return json.dumps(log_data, default=str)
+        if orjson is not None:
+            try:
+                return orjson.dumps(log_data, default=str, option=self._ORJSON_OPTIONS).decode()
+            except orjson.JSONEncodeError:
+                pass
+        return json.dumps(log_data, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+def _json_str(value: str | None) -> str:
+    """Encode an optional str as a JSON value"""
+    return "null" if value is None else encode_basestring(value)
+
+
+def _json_int(value: int | None) -> str:
+    """Encode an optional int as a JSON value"""
+    return "null" if value is None else str(value)
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that tracks the file size itself.
+
+    The stdlib handler seeks to the end of the file and formats the record
+    an extra time on every emit to decide whether to roll over. This one
+    counts what it writes and only rolls over once the count reaches
+    maxBytes, so the current file may overshoot by up to one record.
+    Sizes are counted in characters, which matches bytes for ASCII logs.
+    Every RECONCILE_INTERVAL records the count is reset to the real file
+    size, which also accounts for other processes writing to the file.
+
+    With autoflush=False records are only flushed when the caller calls
+    flush(), see BackgroundLogHandler.
+    """
+
+    RECONCILE_INTERVAL = 1024
+
+    def __init__(
+        self,
+        filename: str,
+        *args: Any,
+        autoflush: bool = True,
+        buffer_size: int = -1,
+        **kwargs: Any,
+    ):
+        self.autoflush = autoflush
+        self.buffer_size = buffer_size
+        self._emit_count = 0
+        super().__init__(filename, *args, **kwargs)
+        try:
+            self._bytes_written = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._bytes_written = 0
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        self._emit_count += 1
+        if self._emit_count >= self.RECONCILE_INTERVAL and self.stream is not None:
+            # Pick up writes by other processes sharing the file, and the
+            # difference between counted characters and encoded bytes
+            self._emit_count = 0
+            self.stream.flush()
+            self._bytes_written = os.fstat(self.stream.fileno()).st_size
+        return 0 < self.maxBytes <= self._bytes_written
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self._bytes_written = 0
+        self._emit_count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg)
+            if self.autoflush:
+                self.flush()
+            self._bytes_written += len(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BackgroundLogHandler(logging.Handler):
+    """
+    Hands records to a background thread that writes them to a target handler.
+
+    Callers only pay for an enqueue. The writer thread drains the queue in
+    batches and flushes the target once per batch, so a busy logger makes
+    one write per batch instead of one per record. Give the target a large
+    buffer and autoflush=False.
+
+    The writer thread is started by the first record. Formatting happens on
+    the writer thread with the target's formatter; setFormatter() is
+    forwarded there. A forked child has no writer thread and writes
+    synchronously through its own file object.
+    """
+
+    _BATCH_SIZE = 256
+    _STOP = None  # queue sentinel
+
+    def __init__(self, target: logging.Handler):
+        super().__init__()
+        self.target = target
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._pid = os.getpid()
+        self._thread: threading.Thread | None = None
+        self._child_pid: int | None = None  # forked child that has reopened the target
+
+    def setFormatter(self, fmt: logging.Formatter | None) -> None:
+        self.target.setFormatter(fmt)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if os.getpid() != self._pid:
+            self._emit_in_child(record)
+            return
+        try:
+            # Handler.handle() holds our lock, so only one caller starts the thread
+            if self._thread is None:
+                self._thread = threading.Thread(name="LogWriter", target=self._run, daemon=True)
+                self._thread.start()
+            self._queue.put(self._prepare(record))
+        except Exception:
+            self.handleError(record)
+
+    @staticmethod
+    def _prepare(record: logging.LogRecord) -> logging.LogRecord:
+        # Other handlers and parent loggers share the record, so queue a copy.
+        # Merge args now, they may be mutated before the writer gets to them
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def _emit_in_child(self, record: logging.LogRecord) -> None:
+        if self._child_pid != os.getpid():
+            self._child_pid = os.getpid()
+            self._detach_inherited_stream()
+        self.target.handle(record)
+        self.target.flush()
+
+    def _detach_inherited_stream(self) -> None:
+        """
+        Drop the file object a forked child inherited from the parent.
+
+        Its buffer may still hold records the parent has not written yet.
+        Point the descriptor at /dev/null so flushing or collecting it can't
+        write them a second time; the target opens the file again on its
+        next emit.
+        """
+        stream = getattr(self.target, "stream", None)
+        if not isinstance(self.target, logging.FileHandler) or stream is None:
+            return
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        try:
+            os.dup2(devnull, stream.fileno())
+        finally:
+            os.close(devnull)
+        self.target.stream = None
+
+    def _run(self) -> None:
+        q = self._queue
+        target = self.target
+        while True:
+            batch = [q.get()]
+            try:
+                while len(batch) < self._BATCH_SIZE:
+                    batch.append(q.get_nowait())
+            except queue.Empty:
+                pass
+            for item in batch:
+                if item is self._STOP:
+                    target.flush()
+                    return
+                if isinstance(item, threading.Event):
+                    # flush() request, everything queued before it has been handled
+                    target.flush()
+                    item.set()
+                else:
+                    target.handle(item)
+            target.flush()
+
+    def _writer_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and os.getpid() == self._pid
+
+    def flush(self) -> None:
+        """Wait until every record queued so far has been written and flushed."""
+        if not self._writer_running():
+            self.target.flush()
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            thread = self._thread
+            if thread is not None and self._writer_running():
+                self._queue.put(self._STOP)
+                thread.join()
+            self.target.close()
+        finally:
+            self.release()
+        super().close()
 
 
 class StandardFormatter(logging.Formatter):
@@ -135,6 +403,12 @@ class LogManager:
     _log_level: int = logging.INFO
     _use_json: bool = False
 
+    # Logger name -> (level, log dir, use_json) it was last configured with
+    _configured: dict[str, tuple[int, str | None, bool]] = {}
+
+    # Write buffer for log files, flushed by the background writer per batch
+    _FILE_BUFFER_SIZE = 64 * 1024
+
     @classmethod
     def initialize(
         cls,
@@ -193,16 +467,21 @@ class LogManager:
             Configured logger instance
         """
         logger = logging.getLogger(name)
+        effective_level = level if level is not None else cls._log_level
+        effective_log_dir = log_dir if log_dir is not None else cls._log_dir
+
+        # Reuse the existing setup if nothing changed, keeping its file open
+        key = (effective_level, effective_log_dir, cls._use_json)
+        if cls._configured.get(name) == key and logger.handlers:
+            return logger
 
         # Remove any existing handlers
         cls._clear_handlers(logger)
 
         # Set level
-        effective_level = level if level is not None else cls._log_level
         logger.setLevel(effective_level)
 
         # Create handler
-        effective_log_dir = log_dir if log_dir is not None else cls._log_dir
         handler = cls._create_handler(name, effective_log_dir)
 
         # Create formatter
@@ -210,6 +489,7 @@ class LogManager:
         handler.setFormatter(formatter)
 
         logger.addHandler(handler)
+        cls._configured[name] = key
 
         return logger
 
@@ -281,10 +561,14 @@ class LogManager:
     def _create_handler(cls, name: str, log_dir: str | None) -> logging.Handler:
         """Create the appropriate handler based on configuration."""
         if log_dir is not None:
-            return RotatingFileHandler(
-                f"{log_dir}/{name}.log",
-                maxBytes=Constants.MAX_LOG_SIZE_IN_BYTES,
-                backupCount=Constants.LOG_BACKUP_COUNT,
+            return BackgroundLogHandler(
+                FastRotatingFileHandler(
+                    f"{log_dir}/{name}.log",
+                    maxBytes=Constants.MAX_LOG_SIZE_IN_BYTES,
+                    backupCount=Constants.LOG_BACKUP_COUNT,
+                    autoflush=False,
+                    buffer_size=cls._FILE_BUFFER_SIZE,
+                )
             )
         else:
             return logging.StreamHandler(sys.stdout)
@@ -329,6 +613,10 @@ def log_with_context(
     Log a message with additional context data.
 
     When using JSON formatting, context data is included in the log output.
+    Returns without doing anything when the logger would drop the record.
+    The message is not formatted here, so keep it cheap to build at the call
+    site (no f-strings over costly values); put such values in **context,
+    which is only serialized if the record is emitted.
 
     Args:
         logger: Logger to use
@@ -336,5 +624,7 @@ def log_with_context(
         message: Log message
         **context: Additional context data to include
     """
+    if not logger.isEnabledFor(level):
+        return
     extra = {"extra_data": context} if context else {}
     logger.log(level, message, extra=extra)
@@ -9,21 +9,33 @@ This module provides:
 - NetworkMountManager: Handles CRUD operations and persistence for network mounts
 """
 
+import hashlib
 import json
 import os
-import uuid
 import re
-from dataclasses import dataclass, field, asdict
-from typing import Optional, List
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from secrets import token_hex
+from typing import Callable, Dict, Iterator, Optional, List
 from enum import Enum
 
 from .error import AppError
 from .persist import Persist, PersistError
 
+# orjson is optional; fall back to the stdlib encoder when it's not installed
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 # Mount point base directory inside the container
 MOUNTS_BASE_DIR = "/mounts"
 
+# Patterns used by sanitize_mount_id
+_WHITESPACE_RE = re.compile(r"\s+")
+_UNSAFE_ID_CHARS_RE = re.compile(r"[^a-z0-9\-_]")
+
 
 class NetworkMountError(AppError):
     """Exception indicating a network mount error"""
@@ -39,6 +51,12 @@ class MountType(str, Enum):
     LOCAL = "local"
 
 
+# MountType never changes, so these are computed once for validate()
+_MOUNT_TYPE_VALUES = frozenset(t.value for t in MountType)
+_MOUNT_TYPE_STR = ", ".join(t.value for t in MountType)
+_REMOTE_MOUNT_TYPES = frozenset((MountType.NFS.value, MountType.CIFS.value))
+
+
 class MountStatus(str, Enum):
     """Mount status values"""
 
@@ -60,18 +78,18 @@ def sanitize_mount_id(name: str) -> str:
     """
     # Convert to lowercase, replace spaces with hyphens
     safe_name = name.lower().strip()
-    safe_name = re.sub(r"\s+", "-", safe_name)
+    safe_name = _WHITESPACE_RE.sub("-", safe_name)
     # Remove any characters that aren't alphanumeric, hyphen, or underscore
-    safe_name = re.sub(r"[^a-z0-9\-_]", "", safe_name)
+    safe_name = _UNSAFE_ID_CHARS_RE.sub("", safe_name)
     # Ensure it doesn't start with a hyphen or underscore
     safe_name = safe_name.lstrip("-_")
     # If empty after sanitization, use a UUID
     if not safe_name:
-        safe_name = str(uuid.uuid4())[:8]
+        safe_name = token_hex(4)
     return safe_name
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkMount:
     """
     Represents a network mount configuration.
@@ -93,12 +111,14 @@ class NetworkMount:
     mount_type: str  # "nfs", "cifs", or "local"
     server: str = ""
     share_path: str = ""
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = field(default_factory=lambda: token_hex(4))
     enabled: bool = True
     username: Optional[str] = None
     password: Optional[str] = None  # Stored encrypted
     domain: Optional[str] = None
     mount_options: str = ""
+    # (key, options) for cifs_options; not persisted or compared
+    _cifs_options_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         # Normalize mount_type to lowercase
@@ -116,14 +136,30 @@ class NetworkMount:
     @property
     def mount_source(self) -> str:
         """Return the mount source string based on mount type."""
-        if self.mount_type == MountType.NFS.value:
-            return f"{self.server}:{self.share_path}"
-        elif self.mount_type == MountType.CIFS.value:
-            return f"//{self.server}/{self.share_path}"
-        elif self.mount_type == MountType.LOCAL.value:
-            return self.share_path
-        else:
-            return ""
+        build = _MOUNT_SOURCE_BUILDERS.get(self.mount_type)
+        return build(self) if build else ""
+
+    @property
+    def cifs_options(self) -> str:
+        """
+        Return the -o option string for a CIFS mount, without the password.
+        Cached on the instance until username, domain or mount_options change.
+        """
+        key = (self.username, self.domain, self.mount_options)
+        cached = self._cifs_options_cache
+        if cached is None or cached[0] != key:
+            options = []
+            if self.username:
+                options.append(f"username={self.username}")
+                if self.domain:
+                    options.append(f"domain={self.domain}")
+            else:
+                options.append("guest")
+            if self.mount_options:
+                options.append(self.mount_options)
+            cached = (key, ",".join(options))
+            self._cifs_options_cache = cached
+        return cached[1]
 
     def validate(self) -> List[str]:
         """
@@ -135,24 +171,22 @@ class NetworkMount:
         Raises:
             NetworkMountError: If the mount has invalid/missing required fields
         """
-        if not self.name or not self.name.strip():
+        if not self.name or self.name.isspace():
             raise NetworkMountError("Mount name cannot be empty")
         if not self.id:
             raise NetworkMountError("Mount ID cannot be empty")
-        if self.mount_type not in [t.value for t in MountType]:
-            raise NetworkMountError(
-                f"Invalid mount type '{self.mount_type}'. Must be one of: {', '.join(t.value for t in MountType)}"
-            )
+        if self.mount_type not in _MOUNT_TYPE_VALUES:
+            raise NetworkMountError(f"Invalid mount type '{self.mount_type}'. Must be one of: {_MOUNT_TYPE_STR}")
 
         # Type-specific validation
-        if self.mount_type in [MountType.NFS.value, MountType.CIFS.value]:
-            if not self.server or not self.server.strip():
+        if self.mount_type in _REMOTE_MOUNT_TYPES:
+            if not self.server or self.server.isspace():
                 raise NetworkMountError(f"Server address is required for {self.mount_type.upper()} mounts")
-            if not self.share_path or not self.share_path.strip():
+            if not self.share_path or self.share_path.isspace():
                 raise NetworkMountError(f"Share path is required for {self.mount_type.upper()} mounts")
 
         if self.mount_type == MountType.LOCAL.value:
-            if not self.share_path or not self.share_path.strip():
+            if not self.share_path or self.share_path.isspace():
                 raise NetworkMountError("Local path is required for local mounts")
             if not os.path.isabs(self.share_path):
                 raise NetworkMountError("Local path must be an absolute path")
@@ -166,12 +200,30 @@ class NetworkMount:
 
         return warnings
 
+    def to_dict(self) -> dict:
+        """
+        Return the persisted fields as a plain dictionary.
+        Cheaper than dataclasses.asdict(), which deep-copies each field.
+        """
+        return {
+            "name": self.name,
+            "mount_type": self.mount_type,
+            "server": self.server,
+            "share_path": self.share_path,
+            "id": self.id,
+            "enabled": self.enabled,
+            "username": self.username,
+            "password": self.password,
+            "domain": self.domain,
+            "mount_options": self.mount_options,
+        }
+
     def to_dict_safe(self) -> dict:
         """
         Return a dictionary representation safe for API responses.
         Excludes the password field.
         """
-        data = asdict(self)
+        data = self.to_dict()
         # Don't expose the encrypted password in API responses
         data["password"] = "***" if self.password else None
         # Add computed fields
@@ -180,7 +232,15 @@ class NetworkMount:
         return data
 
 
-@dataclass
+# mount_type -> mount source string, used by NetworkMount.mount_source
+_MOUNT_SOURCE_BUILDERS: Dict[str, Callable[[NetworkMount], str]] = {
+    MountType.NFS.value: lambda m: f"{m.server}:{m.share_path}",
+    MountType.CIFS.value: lambda m: f"//{m.server}/{m.share_path}",
+    MountType.LOCAL.value: lambda m: m.share_path,
+}
+
+
+@dataclass(slots=True)
 class NetworkMountCollection:
     """
     Collection of network mounts with metadata.
@@ -188,6 +248,22 @@ class NetworkMountCollection:
 
     mounts: list[NetworkMount] = field(default_factory=list)
     version: int = 1  # Schema version for future migrations
+    # Index of mounts by id, kept in sync by the methods below
+    _by_id: dict[str, NetworkMount] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        for mount in self.mounts:
+            self._by_id.setdefault(mount.id, mount)
+
+    def _position(self, mount: NetworkMount) -> int:
+        """
+        Return the list position of an indexed mount.
+        Matches by identity, since list.index would call the dataclass __eq__ on every earlier entry.
+        """
+        for i, item in enumerate(self.mounts):
+            if item is mount:
+                return i
+        raise ValueError(mount.id)
 
     def get_enabled_mounts(self) -> list[NetworkMount]:
         """Return only enabled mounts."""
@@ -195,10 +271,7 @@ class NetworkMountCollection:
 
     def get_mount_by_id(self, mount_id: str) -> Optional[NetworkMount]:
         """Find a mount by its ID."""
-        for mount in self.mounts:
-            if mount.id == mount_id:
-                return mount
-        return None
+        return self._by_id.get(mount_id)
 
     def add_mount(self, mount: NetworkMount) -> List[str]:
         """
@@ -212,9 +285,10 @@ class NetworkMountCollection:
         """
         warnings = mount.validate()
         # Check for duplicate IDs
-        if self.get_mount_by_id(mount.id):
+        if mount.id in self._by_id:
             raise NetworkMountError(f"Mount with id '{mount.id}' already exists")
         self.mounts.append(mount)
+        self._by_id[mount.id] = mount
         return warnings
 
     def update_mount(self, mount: NetworkMount) -> List[str]:
@@ -228,19 +302,19 @@ class NetworkMountCollection:
             NetworkMountError: If validation fails or mount not found
         """
         warnings = mount.validate()
-        for i, existing in enumerate(self.mounts):
-            if existing.id == mount.id:
-                self.mounts[i] = mount
-                return warnings
-        raise NetworkMountError(f"Mount with id '{mount.id}' not found")
+        existing = self._by_id.get(mount.id)
+        if existing is None:
+            raise NetworkMountError(f"Mount with id '{mount.id}' not found")
+        self.mounts[self._position(existing)] = mount
+        self._by_id[mount.id] = mount
+        return warnings
 
     def remove_mount(self, mount_id: str) -> None:
         """Remove a mount by ID."""
-        for i, mount in enumerate(self.mounts):
-            if mount.id == mount_id:
-                del self.mounts[i]
-                return
-        raise NetworkMountError(f"Mount with id '{mount_id}' not found")
+        mount = self._by_id.pop(mount_id, None)
+        if mount is None:
+            raise NetworkMountError(f"Mount with id '{mount_id}' not found")
+        del self.mounts[self._position(mount)]
 
 
 class NetworkMountManager:
@@ -262,6 +336,10 @@ class NetworkMountManager:
         self._config_dir = config_dir
         self._file_path = os.path.join(config_dir, self.FILENAME)
         self._collection: Optional[NetworkMountCollection] = None
+        self._batch_depth = 0
+        self._dirty = False
+        # Digest of the file content last read or written, to skip no-op saves
+        self._last_digest: Optional[bytes] = None
 
     @property
     def file_path(self) -> str:
@@ -283,9 +361,10 @@ class NetworkMountManager:
             return self._collection
 
         try:
-            with open(self._file_path, "r", encoding="utf-8") as f:
+            with open(self._file_path, "rb") as f:
                 content = f.read()
             self._collection = NetworkMountManager.parse_collection(content)
+            self._last_digest = hashlib.blake2b(content, digest_size=8).digest()
             return self._collection
         except (IOError, json.JSONDecodeError) as e:
             raise PersistError(f"Failed to load network mounts: {e}") from e
@@ -295,16 +374,50 @@ class NetworkMountManager:
         if self._collection is None:
             raise NetworkMountError("No mount collection loaded")
 
+        content = self._to_bytes()
+        digest = hashlib.blake2b(content, digest_size=8).digest()
+        if digest == self._last_digest and os.path.isfile(self._file_path):
+            # Nothing changed since the last load/save
+            return
+
         try:
             # Ensure directory exists
             os.makedirs(self._config_dir, exist_ok=True)
 
-            content = self.to_str()
-            with open(self._file_path, "w", encoding="utf-8") as f:
+            # Replace atomically so an interrupted save keeps the previous file
+            tmp_path = self._file_path + ".tmp"
+            with open(tmp_path, "wb") as f:
                 f.write(content)
+            os.replace(tmp_path, self._file_path)
+            self._last_digest = digest
         except IOError as e:
             raise PersistError(f"Failed to save network mounts: {e}") from e
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Defer saving until the outermost batch exits, so that a run of
+        mount changes writes the file once instead of once per change.
+        Nothing is saved if the body raises.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+        # Only reached when the body didn't raise; a failed batch leaves the
+        # collection dirty rather than persisting it half-applied
+        if self._batch_depth == 0 and self._dirty:
+            self.save()
+            self._dirty = False
+
+    def _save_or_defer(self) -> None:
+        """Save now, or mark the collection dirty while inside batch()."""
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self.save()
+
     @property
     def collection(self) -> NetworkMountCollection:
         """Get the current collection, loading if necessary."""
@@ -313,8 +426,8 @@ class NetworkMountManager:
         return self._collection
 
     def get_all_mounts(self) -> list[NetworkMount]:
-        """Get all mounts."""
-        return self.collection.mounts
+        """Get all mounts, as a copy so callers can't desync the id index."""
+        return list(self.collection.mounts)
 
     def get_enabled_mounts(self) -> list[NetworkMount]:
         """Get only enabled mounts."""
@@ -327,27 +440,45 @@ class NetworkMountManager:
     def add_mount(self, mount: NetworkMount) -> List[str]:
         """Add a new mount and save."""
         warnings = self.collection.add_mount(mount)
-        self.save()
+        self._save_or_defer()
+        return warnings
+
+    def add_mounts(self, mounts: List[NetworkMount]) -> List[str]:
+        """Add several mounts and save once. If any mount is rejected, none are added."""
+        warnings: List[str] = []
+        added: List[str] = []
+        with self.batch():
+            try:
+                for mount in mounts:
+                    warnings.extend(self.collection.add_mount(mount))
+                    added.append(mount.id)
+            except NetworkMountError:
+                for mount_id in added:
+                    self.collection.remove_mount(mount_id)
+                raise
+            if added:
+                self._dirty = True
         return warnings
 
     def update_mount(self, mount: NetworkMount) -> List[str]:
         """Update an existing mount and save."""
         warnings = self.collection.update_mount(mount)
-        self.save()
+        self._save_or_defer()
         return warnings
 
     def remove_mount(self, mount_id: str) -> None:
         """Remove a mount and save."""
         self.collection.remove_mount(mount_id)
-        self.save()
+        self._save_or_defer()
 
     @classmethod
-    def parse_collection(cls, content: str) -> NetworkMountCollection:
+    def parse_collection(cls, content: str | bytes) -> NetworkMountCollection:
         """
         Parse a JSON string into a NetworkMountCollection.
         """
         try:
-            data = json.loads(content)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            data = orjson.loads(content) if orjson else json.loads(content)
         except json.JSONDecodeError as e:
             raise PersistError(f"Invalid JSON: {e}") from e
 
@@ -356,9 +487,16 @@ class NetworkMountManager:
 
         mounts = []
         for mount_data in mounts_data:
+            try:
+                # Entries written by to_str carry exactly the constructor's fields
+                mounts.append(NetworkMount(**mount_data))
+                continue
+            except TypeError:
+                # Missing or unknown keys; fill in the defaults field by field below
+                pass
             try:
                 mount = NetworkMount(
-                    id=mount_data.get("id", str(uuid.uuid4())[:8]),
+                    id=mount_data.get("id", token_hex(4)),
                     name=mount_data["name"],
                     mount_type=mount_data["mount_type"],
                     enabled=mount_data.get("enabled", True),
@@ -379,11 +517,24 @@ class NetworkMountManager:
         """
         Serialize the NetworkMountCollection to a JSON string.
         """
+        return self._to_bytes().decode("utf-8")
+
+    def _to_bytes(self) -> bytes:
+        """
+        Serialize the NetworkMountCollection to UTF-8 encoded JSON.
+        Uses orjson when available, which serializes the dataclasses natively.
+        """
         if self._collection is None:
             raise NetworkMountError("No mount collection loaded")
 
+        if orjson:
+            data = {
+                "version": self._collection.version,
+                "mounts": self._collection.mounts,
+            }
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
         data = {
             "version": self._collection.version,
-            "mounts": [asdict(mount) for mount in self._collection.mounts],
+            "mounts": [mount.to_dict() for mount in self._collection.mounts],
         }
-        return json.dumps(data, indent=2)
+        return json.dumps(data, indent=2).encode("utf-8")
@@ -8,18 +8,28 @@ This module provides:
 - PathPairManager: Handles CRUD operations and persistence for path pairs
 """
 
+import functools
+import hashlib
+import heapq
 import json
 import os
 import shutil
 import uuid
-from dataclasses import dataclass, field, asdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Tuple
-from pathlib import Path
+from typing import Iterator, Optional, List, Tuple
+from pathlib import Path, PurePosixPath
 
 from .error import AppError
 from .persist import Persist, PersistError
 
+# orjson is optional; fall back to the stdlib encoder when it's not installed
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 # Docker container expected base directory for downloads
 DOCKER_DOWNLOADS_BASE = "/downloads"
@@ -27,6 +37,10 @@ DOCKER_DOWNLOADS_BASE = "/downloads"
 # Docker container expected base directory for network mounts
 DOCKER_MOUNTS_BASE = "/mounts"
 
+# Path forms of the above, compared against each validated local_path
+_DOWNLOADS_BASE_PATH = PurePosixPath(DOCKER_DOWNLOADS_BASE)
+_MOUNTS_BASE_PATH = PurePosixPath(DOCKER_MOUNTS_BASE)
+
 
 class PathPairError(AppError):
     """Exception indicating a path pair error"""
@@ -34,9 +48,11 @@ class PathPairError(AppError):
     pass
 
 
+@functools.lru_cache(maxsize=1)
 def is_running_in_docker() -> bool:
     """
     Detect if we're running inside a Docker container.
+    The result is cached, since it cannot change while the process runs.
 
     Returns:
         True if running in Docker, False otherwise
@@ -55,7 +71,7 @@ def is_running_in_docker() -> bool:
     return False
 
 
-@dataclass
+@dataclass(slots=True)
 class PathPair:
     """
     Represents a single source (remote) to destination (local) path mapping.
@@ -82,6 +98,20 @@ class PathPair:
             # Use the last directory component of remote_path as default name
             self.name = os.path.basename(self.remote_path.rstrip("/")) or "Default"
 
+    def to_dict(self) -> dict:
+        """
+        Return the persisted fields as a plain dictionary.
+        Every field is a scalar, so no recursive copy is needed.
+        """
+        return {
+            "remote_path": self.remote_path,
+            "local_path": self.local_path,
+            "name": self.name,
+            "id": self.id,
+            "enabled": self.enabled,
+            "auto_queue": self.auto_queue,
+        }
+
     def validate(self) -> List[str]:
         """
         Validate the path pair configuration.
@@ -92,9 +122,9 @@ class PathPair:
         Raises:
             PathPairError: If the path pair has invalid/missing required fields
         """
-        if not self.remote_path or not self.remote_path.strip():
+        if not self.remote_path or self.remote_path.isspace():
             raise PathPairError(f"Path pair '{self.name}': remote_path cannot be empty")
-        if not self.local_path or not self.local_path.strip():
+        if not self.local_path or self.local_path.isspace():
             raise PathPairError(f"Path pair '{self.name}': local_path cannot be empty")
         if not self.id:
             raise PathPairError(f"Path pair '{self.name}': id cannot be empty")
@@ -103,19 +133,15 @@ class PathPair:
 
         # Docker-specific validation: warn if local_path is not under /downloads or /mounts
         if is_running_in_docker():
-            local_path_normalized = os.path.normpath(self.local_path)
-            downloads_base = os.path.normpath(DOCKER_DOWNLOADS_BASE)
-            mounts_base = os.path.normpath(DOCKER_MOUNTS_BASE)
+            # normpath first so that ".." components can't escape the base
+            local_path = PurePosixPath(os.path.normpath(self.local_path))
 
-            # Check if local_path is a subdirectory of /downloads or /mounts
-            is_under_downloads = local_path_normalized == downloads_base or local_path_normalized.startswith(
-                downloads_base + os.sep
-            )
-            is_under_mounts = local_path_normalized == mounts_base or local_path_normalized.startswith(
-                mounts_base + os.sep
+            # Check if local_path is /downloads or /mounts, or a subdirectory of either
+            is_under_base = local_path.is_relative_to(_DOWNLOADS_BASE_PATH) or local_path.is_relative_to(
+                _MOUNTS_BASE_PATH
             )
 
-            if not is_under_downloads and not is_under_mounts:
+            if not is_under_base:
                 warnings.append(
                     f"Path pair '{self.name}': Local path '{self.local_path}' is not under "
                     f"'{DOCKER_DOWNLOADS_BASE}' or '{DOCKER_MOUNTS_BASE}'. In Docker, all local paths should be "
@@ -127,7 +153,7 @@ class PathPair:
         return warnings
 
 
-@dataclass
+@dataclass(slots=True)
 class PathPairCollection:
     """
     Collection of path pairs with metadata.
@@ -135,6 +161,22 @@ class PathPairCollection:
 
     path_pairs: list[PathPair] = field(default_factory=list)
     version: int = 1  # Schema version for future migrations
+    # Index of path_pairs by id, kept in sync by the methods below
+    _by_id: dict[str, PathPair] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        for pair in self.path_pairs:
+            self._by_id.setdefault(pair.id, pair)
+
+    def _position(self, pair: PathPair) -> int:
+        """
+        Find where an indexed pair sits in path_pairs, comparing by identity
+        rather than the field-by-field equality list.index would use.
+        """
+        for i, item in enumerate(self.path_pairs):
+            if item is pair:
+                return i
+        raise ValueError(pair.id)
 
     def get_enabled_pairs(self) -> list[PathPair]:
         """Return only enabled path pairs."""
@@ -142,10 +184,7 @@ class PathPairCollection:
 
     def get_pair_by_id(self, pair_id: str) -> Optional[PathPair]:
         """Find a path pair by its ID."""
-        for pair in self.path_pairs:
-            if pair.id == pair_id:
-                return pair
-        return None
+        return self._by_id.get(pair_id)
 
     def add_pair(self, pair: PathPair) -> List[str]:
         """
@@ -159,9 +198,10 @@ class PathPairCollection:
         """
         warnings = pair.validate()
         # Check for duplicate IDs
-        if self.get_pair_by_id(pair.id):
+        if pair.id in self._by_id:
             raise PathPairError(f"Path pair with id '{pair.id}' already exists")
         self.path_pairs.append(pair)
+        self._by_id[pair.id] = pair
         return warnings
 
     def update_pair(self, pair: PathPair) -> List[str]:
@@ -175,27 +215,35 @@ class PathPairCollection:
             PathPairError: If validation fails or pair not found
         """
         warnings = pair.validate()
-        for i, existing in enumerate(self.path_pairs):
-            if existing.id == pair.id:
-                self.path_pairs[i] = pair
-                return warnings
-        raise PathPairError(f"Path pair with id '{pair.id}' not found")
+        existing = self._by_id.get(pair.id)
+        if existing is None:
+            raise PathPairError(f"Path pair with id '{pair.id}' not found")
+        self.path_pairs[self._position(existing)] = pair
+        self._by_id[pair.id] = pair
+        return warnings
 
     def remove_pair(self, pair_id: str) -> None:
         """Remove a path pair by ID."""
-        for i, pair in enumerate(self.path_pairs):
-            if pair.id == pair_id:
-                del self.path_pairs[i]
-                return
-        raise PathPairError(f"Path pair with id '{pair_id}' not found")
+        pair = self._by_id.pop(pair_id, None)
+        if pair is None:
+            raise PathPairError(f"Path pair with id '{pair_id}' not found")
+        del self.path_pairs[self._position(pair)]
 
     def reorder_pairs(self, pair_ids: list[str]) -> None:
         """Reorder path pairs according to the given ID list."""
-        if set(pair_ids) != {p.id for p in self.path_pairs}:
-            raise PathPairError("Reorder list must contain all existing path pair IDs")
+        error = "Reorder list must contain all existing path pair IDs"
+        # Popping each id rejects unknown and repeated ids in the same pass
+        remaining = dict(self._by_id)
+        reordered = []
+        for pid in pair_ids:
+            pair = remaining.pop(pid, None)
+            if pair is None:
+                raise PathPairError(error)
+            reordered.append(pair)
+        if remaining:
+            raise PathPairError(error)
 
-        id_to_pair = {p.id: p for p in self.path_pairs}
-        self.path_pairs = [id_to_pair[pid] for pid in pair_ids]
+        self.path_pairs = reordered
 
 
 class PathPairManager:
@@ -218,6 +266,10 @@ class PathPairManager:
         self._config_dir = config_dir
         self._file_path = os.path.join(config_dir, self.FILENAME)
         self._collection: Optional[PathPairCollection] = None
+        self._batch_depth = 0
+        self._dirty = False
+        # Digest of the file content last read or written, to skip no-op saves
+        self._last_digest: Optional[bytes] = None
 
     @property
     def file_path(self) -> str:
@@ -234,9 +286,10 @@ class PathPairManager:
             return self._collection
 
         try:
-            with open(self._file_path, "r", encoding="utf-8") as f:
+            with open(self._file_path, "rb") as f:
                 content = f.read()
             self._collection = PathPairManager.parse_collection(content)
+            self._last_digest = hashlib.blake2b(content, digest_size=8).digest()
             return self._collection
         except (IOError, json.JSONDecodeError) as e:
             raise PersistError(f"Failed to load path pairs: {e}") from e
@@ -246,6 +299,12 @@ class PathPairManager:
         if self._collection is None:
             raise PathPairError("No path pair collection loaded")
 
+        content = self._to_bytes()
+        digest = hashlib.blake2b(content, digest_size=8).digest()
+        if digest == self._last_digest and os.path.isfile(self._file_path):
+            # Nothing changed since the last load/save; skip the backup and write
+            return
+
         try:
             # Ensure directory exists
             os.makedirs(self._config_dir, exist_ok=True)
@@ -257,21 +316,56 @@ class PathPairManager:
                 file_name = os.path.basename(self._file_path)
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 backup_path = os.path.join(backup_dir, f"{file_name}.{timestamp}.bak")
-                shutil.copy(self._file_path, backup_path)
-                # Rotate: keep only the 10 most recent backups for this file
+                # The file is replaced rather than rewritten below, so a hard link
+                # preserves the old content without copying it
+                try:
+                    os.link(self._file_path, backup_path)
+                except OSError:
+                    shutil.copy(self._file_path, backup_path)
+                # Rotate: keep only the 10 most recent backups for this file.
+                # Timestamped names sort chronologically, so the oldest are the smallest.
                 prefix = file_name + "."
-                existing = sorted(
-                    [f for f in os.listdir(backup_dir) if f.startswith(prefix) and f.endswith(".bak")]
-                )
-                for old in existing[:-10]:
-                    os.remove(os.path.join(backup_dir, old))
-
-            content = self.to_str()
-            with open(self._file_path, "w", encoding="utf-8") as f:
+                with os.scandir(backup_dir) as it:
+                    existing = [e.name for e in it if e.name.startswith(prefix) and e.name.endswith(".bak")]
+                if len(existing) > 10:
+                    for old in heapq.nsmallest(len(existing) - 10, existing):
+                        os.remove(os.path.join(backup_dir, old))
+
+            # Write to a temp file and rename over the original, so a crash
+            # mid-write can't leave a truncated file behind
+            tmp_path = self._file_path + ".tmp"
+            with open(tmp_path, "wb") as f:
                 f.write(content)
+            os.replace(tmp_path, self._file_path)
+            self._last_digest = digest
         except IOError as e:
             raise PersistError(f"Failed to save path pairs: {e}") from e
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Defer saving until the outermost batch exits, so that a run of
+        path pair changes writes the file once instead of once per change.
+        Nothing is saved if the body raises.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+        # Only reached when the body didn't raise; a failed batch leaves the
+        # collection dirty rather than persisting it half-applied
+        if self._batch_depth == 0 and self._dirty:
+            self.save()
+            self._dirty = False
+
+    def _save_or_defer(self) -> None:
+        """Save now, or mark the collection dirty while inside batch()."""
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self.save()
+
     @property
     def collection(self) -> PathPairCollection:
         """Get the current collection, loading if necessary."""
@@ -280,8 +374,8 @@ class PathPairManager:
         return self._collection
 
     def get_all_pairs(self) -> list[PathPair]:
-        """Get all path pairs."""
-        return self.collection.path_pairs
+        """Get all path pairs, as a copy so callers can't desync the id index."""
+        return list(self.collection.path_pairs)
 
     def get_enabled_pairs(self) -> list[PathPair]:
         """Get only enabled path pairs."""
@@ -294,30 +388,46 @@ class PathPairManager:
     def add_pair(self, pair: PathPair) -> None:
         """Add a new path pair and save."""
         self.collection.add_pair(pair)
-        self.save()
+        self._save_or_defer()
+
+    def add_pairs(self, pairs: List[PathPair]) -> None:
+        """Add several path pairs and save once. If any pair is rejected, none are added."""
+        added: List[str] = []
+        with self.batch():
+            try:
+                for pair in pairs:
+                    self.collection.add_pair(pair)
+                    added.append(pair.id)
+            except PathPairError:
+                for pair_id in added:
+                    self.collection.remove_pair(pair_id)
+                raise
+            if added:
+                self._dirty = True
 
     def update_pair(self, pair: PathPair) -> None:
         """Update an existing path pair and save."""
         self.collection.update_pair(pair)
-        self.save()
+        self._save_or_defer()
 
     def remove_pair(self, pair_id: str) -> None:
         """Remove a path pair and save."""
         self.collection.remove_pair(pair_id)
-        self.save()
+        self._save_or_defer()
 
     def reorder_pairs(self, pair_ids: list[str]) -> None:
         """Reorder path pairs and save."""
         self.collection.reorder_pairs(pair_ids)
-        self.save()
+        self._save_or_defer()
 
     @classmethod
-    def parse_collection(cls, content: str) -> "PathPairCollection":
+    def parse_collection(cls, content: str | bytes) -> "PathPairCollection":
         """
         Parse a JSON string into a PathPairCollection.
         """
         try:
-            data = json.loads(content)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            data = orjson.loads(content) if orjson else json.loads(content)
         except json.JSONDecodeError as e:
             raise PersistError(f"Invalid JSON: {e}") from e
 
@@ -326,6 +436,13 @@ class PathPairManager:
 
         path_pairs = []
         for pair_data in path_pairs_data:
+            try:
+                # Entries written by to_str carry exactly the constructor's fields
+                path_pairs.append(PathPair(**pair_data))
+                continue
+            except TypeError:
+                # Missing or unknown keys; fill in the defaults field by field below
+                pass
             try:
                 pair = PathPair(
                     id=pair_data.get("id", str(uuid.uuid4())),
@@ -345,14 +462,27 @@ class PathPairManager:
         """
         Serialize the PathPairCollection to a JSON string.
         """
+        return self._to_bytes().decode("utf-8")
+
+    def _to_bytes(self) -> bytes:
+        """
+        Serialize the PathPairCollection to UTF-8 encoded JSON.
+        Uses orjson when available, which serializes the dataclasses natively.
+        """
         if self._collection is None:
             raise PathPairError("No path pair collection loaded")
 
+        if orjson:
+            data = {
+                "version": self._collection.version,
+                "path_pairs": self._collection.path_pairs,
+            }
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
         data = {
             "version": self._collection.version,
-            "path_pairs": [asdict(pair) for pair in self._collection.path_pairs],
+            "path_pairs": [pair.to_dict() for pair in self._collection.path_pairs],
         }
-        return json.dumps(data, indent=2)
+        return json.dumps(data, indent=2).encode("utf-8")
 
     def migrate_from_config(self, remote_path: str, local_path: str) -> bool:
         """
@@ -1,7 +1,8 @@
 # Copyright 2017, Inderpreet Singh, All rights reserved.
 
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, TypeVar, Type
+from typing import Any, TypeVar, Type, List
 from threading import Lock
 
 from common import overrides
@@ -29,14 +30,29 @@ class BaseStatus:
     # noinspection PyProtectedMember
     @classmethod
     def _create_property(cls, name: str) -> property:
+        # Values are stored in the instance __dict__ under this key
+        name = sys.intern(name)
         return property(fget=lambda s: s._get_property(name),
                         fset=lambda s, v: s._set_property(name, v))
 
     def _get_property(self, name: str) -> Any:
-        return getattr(self, "__" + name, None)
+        return self.__dict__.get(name, None)
 
     def _set_property(self, name: str, value: Any):
-        setattr(self, "__" + name, value)
+        self.__dict__[name] = value
+
+    @classmethod
+    def _property_names(cls) -> List[str]:
+        """
+        Returns the names of all properties of this class
+        Properties are fixed at class creation, so the scan is done once per class
+        :return:
+        """
+        names = cls.__dict__.get("_cached_property_names")
+        if names is None:
+            names = [p for p in dir(cls) if isinstance(getattr(cls, p), property)]
+            cls._cached_property_names = names
+        return names
 
 
 class StatusComponent(BaseStatus):
@@ -58,9 +74,10 @@ class StatusComponent(BaseStatus):
 
     @classmethod
     def copy(cls: Type[T], src: T, dst: T) -> None:
-        property_names = [p for p in dir(cls) if isinstance(getattr(cls, p), property)]
-        for prop in property_names:
-            setattr(dst, "__" + prop, getattr(src, "__" + prop))
+        src_values = src.__dict__
+        dst_values = dst.__dict__
+        for prop in cls._property_names():
+            dst_values[prop] = src_values.get(prop, None)
 
     @overrides(BaseStatus)
     def _set_property(self, name: str, value: Any):
@@ -146,9 +163,7 @@ class Status(BaseStatus):
 
     def copy(self) -> "Status":
         copy = Status()
-        cls = Status
-        property_names = [p for p in dir(cls) if isinstance(getattr(cls, p), property)]
-        for prop in property_names:
+        for prop in Status._property_names():
             src_comp = self._get_property(prop)
             dst_comp = copy._get_property(prop)
             src_comp.__class__.copy(src_comp, dst_comp)
@@ -8,11 +8,11 @@ including chunk-level checksums and adaptive sizing configuration.
 """
 
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Optional
+from enum import Enum, IntEnum
+from typing import ClassVar, Optional
 
 
-class ChunkStatus(Enum):
+class ChunkStatus(IntEnum):
     """Status of a file chunk during validation."""
 
     PENDING = 0  # Not yet validated
@@ -30,10 +30,18 @@ class ValidationAlgorithm(Enum):
     SHA256 = "sha256"
     SHA1 = "sha1"
     XXH128 = "xxh128"
+    BLAKE3 = "blake3"  # needs the blake3 package locally and b3sum on the remote
 
 
-@dataclass
-class ChunkInfo:
+class _OwnedChunk:
+    # The FileValidationInfo counting this chunk's status, set when it takes the chunk.
+    # A plain slot rather than a dataclass field, so asdict(), repr() and == never
+    # follow the back-reference into the owner.
+    __slots__ = ("_owner",)
+
+
+@dataclass(slots=True)
+class ChunkInfo(_OwnedChunk):
     """
     Represents a chunk of a file for validation purposes.
 
@@ -43,7 +51,8 @@ class ChunkInfo:
         size: Chunk size in bytes
         remote_checksum: Expected checksum from remote server
         local_checksum: Calculated checksum from local file
-        status: Current status of this chunk
+        status: Current status of this chunk (read-only). Changed through the
+            mark_* methods so the owning FileValidationInfo keeps its counts in step.
         retry_count: Number of times this chunk has been re-downloaded
     """
 
@@ -52,8 +61,16 @@ class ChunkInfo:
     size: int
     remote_checksum: Optional[str] = None
     local_checksum: Optional[str] = None
-    status: ChunkStatus = ChunkStatus.PENDING
     retry_count: int = 0
+    _status: ChunkStatus = field(default=ChunkStatus.PENDING, init=False)
+
+    def __post_init__(self):
+        self._owner: Optional["FileValidationInfo"] = None
+
+    @property
+    def status(self) -> ChunkStatus:
+        """Current status of this chunk."""
+        return self._status
 
     @property
     def end_offset(self) -> int:
@@ -69,21 +86,35 @@ class ChunkInfo:
             and self.remote_checksum == self.local_checksum
         )
 
+    def _set_status(self, status: ChunkStatus):
+        old = self._status
+        self._status = status
+        if self._owner is not None and old is not status:
+            self._owner._on_chunk_status_change(self, old, status)
+
+    def mark_pending(self):
+        """Mark this chunk as pending validation."""
+        self._set_status(ChunkStatus.PENDING)
+
+    def mark_validating(self):
+        """Mark this chunk as being validated."""
+        self._set_status(ChunkStatus.VALIDATING)
+
     def mark_valid(self):
         """Mark this chunk as valid."""
-        self.status = ChunkStatus.VALID
+        self._set_status(ChunkStatus.VALID)
 
     def mark_corrupt(self):
         """Mark this chunk as corrupt."""
-        self.status = ChunkStatus.CORRUPT
+        self._set_status(ChunkStatus.CORRUPT)
 
     def mark_downloading(self):
         """Mark this chunk as being re-downloaded."""
-        self.status = ChunkStatus.DOWNLOADING
+        self._set_status(ChunkStatus.DOWNLOADING)
         self.retry_count += 1
 
 
-@dataclass
+@dataclass(slots=True)
 class FileValidationInfo:
     """
     Tracks validation state for a single file.
@@ -92,7 +123,7 @@ class FileValidationInfo:
         file_path: Relative path to the file
         file_size: Total size of the file in bytes
         algorithm: Checksum algorithm being used
-        chunks: List of chunk information
+        chunks: Chunk information, fixed once the FileValidationInfo is created
         full_file_checksum: Optional full-file checksum for final verification
         is_complete: Whether validation has completed
         is_valid: Whether file passed validation (None if incomplete)
@@ -101,11 +132,61 @@ class FileValidationInfo:
     file_path: str
     file_size: int
     algorithm: ValidationAlgorithm = ValidationAlgorithm.XXH128
-    chunks: list[ChunkInfo] = field(default_factory=list)
+    chunks: tuple[ChunkInfo, ...] = ()
     full_file_checksum: Optional[str] = None
     local_full_checksum: Optional[str] = None
     is_complete: bool = False
     is_valid: Optional[bool] = None
+    # Maintained by the chunks' mark_* methods so the properties below don't rescan chunks
+    _valid_count: int = field(default=0, init=False, repr=False, compare=False)
+    _corrupt: dict[int, ChunkInfo] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # A tuple, so the chunks can't be added or removed behind the counts' back
+        object.__setattr__(self, "chunks", tuple(self.chunks))
+        for chunk in self.chunks:
+            if chunk._owner is not None:
+                raise ValueError(f"Chunk {chunk.index} already belongs to {chunk._owner.file_path}")
+            chunk._owner = self
+            if chunk.status == ChunkStatus.VALID:
+                self._valid_count += 1
+            elif chunk.status == ChunkStatus.CORRUPT:
+                self._corrupt[chunk.index] = chunk
+
+    def __setattr__(self, name: str, value):
+        if name == "chunks" and hasattr(self, "chunks"):
+            raise AttributeError("FileValidationInfo.chunks can't be replaced")
+        object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_layout(
+        cls,
+        file_path: str,
+        file_size: int,
+        chunk_size: int,
+        algorithm: ValidationAlgorithm = ValidationAlgorithm.XXH128,
+    ) -> "FileValidationInfo":
+        """
+        Create validation info with the file split into chunk_size chunks.
+        The last chunk holds the remainder and may be smaller.
+        """
+        chunks = [
+            ChunkInfo(index=index, offset=offset, size=chunk_size)
+            for index, offset in enumerate(range(0, file_size, chunk_size))
+        ]
+        if chunks:
+            chunks[-1].size = file_size - chunks[-1].offset
+        return cls(file_path=file_path, file_size=file_size, algorithm=algorithm, chunks=chunks)
+
+    def _on_chunk_status_change(self, chunk: ChunkInfo, old: ChunkStatus, new: ChunkStatus):
+        if old == ChunkStatus.VALID:
+            self._valid_count -= 1
+        elif old == ChunkStatus.CORRUPT:
+            self._corrupt.pop(chunk.index, None)
+        if new == ChunkStatus.VALID:
+            self._valid_count += 1
+        elif new == ChunkStatus.CORRUPT:
+            self._corrupt[chunk.index] = chunk
 
     @property
     def total_chunks(self) -> int:
@@ -115,22 +196,22 @@ class FileValidationInfo:
     @property
     def validated_chunks(self) -> int:
         """Returns the number of validated chunks."""
-        return sum(1 for c in self.chunks if c.status in (ChunkStatus.VALID, ChunkStatus.CORRUPT))
+        return self._valid_count + len(self._corrupt)
 
     @property
     def valid_chunks(self) -> int:
         """Returns the number of valid chunks."""
-        return sum(1 for c in self.chunks if c.status == ChunkStatus.VALID)
+        return self._valid_count
 
     @property
     def corrupt_chunks(self) -> list[ChunkInfo]:
         """Returns list of corrupt chunks."""
-        return [c for c in self.chunks if c.status == ChunkStatus.CORRUPT]
+        return [self._corrupt[i] for i in self.corrupt_chunk_indices]
 
     @property
     def corrupt_chunk_indices(self) -> list[int]:
         """Returns list of corrupt chunk indices."""
-        return [c.index for c in self.chunks if c.status == ChunkStatus.CORRUPT]
+        return sorted(self._corrupt)
 
     @property
     def progress(self) -> float:
@@ -140,7 +221,7 @@ class FileValidationInfo:
         return self.validated_chunks / self.total_chunks
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationConfig:
     """
     Configuration for download validation.
@@ -213,18 +294,21 @@ class ValidationConfig:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkStats:
     """
     Network statistics for adaptive chunk sizing.
 
     Attributes:
-        avg_speed_bytes_per_sec: Average transfer speed
-        recent_failure_rate: Failure rate of recent transfers (0.0 to 1.0)
+        avg_speed_bytes_per_sec: Average transfer speed (exponentially weighted)
+        recent_failure_rate: Failure rate of recent transfers (0.0 to 1.0, exponentially weighted)
         recent_chunk_failures: Number of chunk failures in recent window
         recent_chunk_successes: Number of chunk successes in recent window
     """
 
+    # Weight given to each new sample in the moving averages (TCP RTT-style gain)
+    ALPHA: ClassVar[float] = 0.125
+
     avg_speed_bytes_per_sec: float = 0.0
     recent_failure_rate: float = 0.0
     recent_chunk_failures: int = 0
@@ -234,15 +318,26 @@ class NetworkStats:
         """Record the result of a chunk validation."""
         if success:
             self.recent_chunk_successes += 1
+            self.recent_failure_rate -= self.ALPHA * self.recent_failure_rate
         else:
             self.recent_chunk_failures += 1
+            self.recent_failure_rate += self.ALPHA * (1.0 - self.recent_failure_rate)
 
-        total = self.recent_chunk_failures + self.recent_chunk_successes
-        if total > 0:
-            self.recent_failure_rate = self.recent_chunk_failures / total
+    def record_speed(self, speed_bytes_per_sec: float):
+        """Fold a transfer speed sample into the moving average."""
+        if self.avg_speed_bytes_per_sec <= 0:
+            self.avg_speed_bytes_per_sec = speed_bytes_per_sec
+        else:
+            self.avg_speed_bytes_per_sec += self.ALPHA * (speed_bytes_per_sec - self.avg_speed_bytes_per_sec)
 
     def reset_window(self):
-        """Reset the statistics window."""
+        """
+        Reset the statistics window.
+
+        This also zeroes recent_failure_rate, so the failure history the moving
+        average keeps is discarded, and AdaptiveChunkSizer.reset_stats() goes
+        through here. The speed average is left as it is.
+        """
         self.recent_chunk_failures = 0
         self.recent_chunk_successes = 0
         self.recent_failure_rate = 0.0
@@ -58,11 +58,11 @@ class AdaptiveChunkSizer:
         Update network statistics.
 
         Args:
-            avg_speed: Average transfer speed in bytes/sec
+            avg_speed: Transfer speed sample in bytes/sec, folded into the moving average
             chunk_success: Whether the last chunk validation succeeded
         """
         if avg_speed is not None:
-            self._network_stats.avg_speed_bytes_per_sec = avg_speed
+            self._network_stats.record_speed(avg_speed)
         if chunk_success is not None:
             self._network_stats.record_chunk_result(chunk_success)
 
@@ -13,10 +13,17 @@ import hashlib
 import logging
 import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Optional
 
 import xxhash
 
+# blake3 is optional; only needed when ValidationAlgorithm.BLAKE3 is selected
+try:
+    import blake3
+except ImportError:  # pragma: no cover
+    blake3 = None
+
 from common import ValidationAlgorithm, ChunkInfo, AppError
 from ssh import Sshcp, SshcpError
 
@@ -81,14 +88,39 @@ class ChecksumGenerator(ABC):
 
 
 class LocalChecksumGenerator(ChecksumGenerator):
-    """Generate checksums for local files."""
-
-    def __init__(self, algorithm: ValidationAlgorithm = ValidationAlgorithm.XXH128, buffer_size: int = 1048576):
+    """
+    Generate checksums for local files.
+
+    With workers > 1, compute_chunk_checksums hashes chunks concurrently on a
+    thread pool owned by this generator. pread and the hash update calls
+    release the GIL, so disk reads and hashing overlap across chunks.
+    """
+
+    def __init__(
+        self,
+        algorithm: ValidationAlgorithm = ValidationAlgorithm.XXH128,
+        buffer_size: int = 1048576,
+        workers: int = 1,
+    ):
         super().__init__(algorithm)
         self.buffer_size = buffer_size
+        self.workers = max(1, workers)
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def close(self):
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def _get_hasher(self, multithreaded: bool = False):
+        """
+        Create a new hasher instance based on the algorithm.
 
-    def _get_hasher(self):
-        """Create a new hasher instance based on the algorithm."""
+        Args:
+            multithreaded: Let hashers that can split one input across threads (BLAKE3) do so.
+                Only for single-stream work; chunks are already spread over the worker pool.
+        """
         if self.algorithm == ValidationAlgorithm.MD5:
             return hashlib.md5()
         elif self.algorithm == ValidationAlgorithm.SHA256:
@@ -97,6 +129,12 @@ class LocalChecksumGenerator(ChecksumGenerator):
             return hashlib.sha1()
         elif self.algorithm == ValidationAlgorithm.XXH128:
             return xxhash.xxh128()
+        elif self.algorithm == ValidationAlgorithm.BLAKE3:
+            if blake3 is None:
+                raise ChecksumError("The blake3 package is required for the blake3 algorithm")
+            if multithreaded:
+                return blake3.blake3(max_threads=blake3.blake3.AUTO)
+            return blake3.blake3()
         else:
             raise ChecksumError(f"Unsupported algorithm: {self.algorithm}")
 
@@ -107,7 +145,7 @@ class LocalChecksumGenerator(ChecksumGenerator):
         if os.path.isdir(file_path):
             raise ChecksumError(f"Cannot compute checksum for directory: {file_path}")
 
-        hasher = self._get_hasher()
+        hasher = self._get_hasher(multithreaded=True)
         try:
             with open(file_path, "rb") as f:
                 while True:
@@ -126,29 +164,71 @@ class LocalChecksumGenerator(ChecksumGenerator):
         if os.path.isdir(file_path):
             raise ChecksumError(f"Cannot compute checksum for directory: {file_path}")
 
-        hasher = self._get_hasher()
         try:
-            with open(file_path, "rb") as f:
-                f.seek(offset)
-                remaining = size
-                while remaining > 0:
-                    to_read = min(self.buffer_size, remaining)
-                    data = f.read(to_read)
-                    if not data:
-                        break
-                    hasher.update(data)
-                    remaining -= len(data)
-            return hasher.hexdigest()
-        except IOError as e:
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                return self._hash_range(fd, offset, size)
+            finally:
+                os.close(fd)
+        except OSError as e:
             raise ChecksumError(f"Error reading file {file_path}: {e}") from e
 
     def compute_chunk_checksums(self, file_path: str, chunks: list[ChunkInfo]) -> list[str]:
-        """Compute checksums for multiple chunks of a local file."""
-        checksums = []
-        for chunk in chunks:
-            checksum = self.compute_chunk_checksum(file_path, chunk.offset, chunk.size)
-            checksums.append(checksum)
-        return checksums
+        """
+        Compute checksums for multiple chunks of a local file.
+
+        The file is opened once for the whole batch. Each chunk is read with
+        pread at its own offset, so workers can share the descriptor.
+        """
+        if not chunks:
+            return []
+        if os.path.isdir(file_path):
+            raise ChecksumError(f"Cannot compute checksum for directory: {file_path}")
+
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except FileNotFoundError as e:
+            raise ChecksumError(f"File not found: {file_path}") from e
+        except OSError as e:
+            raise ChecksumError(f"Error reading file {file_path}: {e}") from e
+        try:
+            self._advise_willneed(fd, chunks)
+            if self.workers == 1 or len(chunks) == 1:
+                return [self._hash_range(fd, chunk.offset, chunk.size) for chunk in chunks]
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="checksum")
+            futures = [self._pool.submit(self._hash_range, fd, chunk.offset, chunk.size) for chunk in chunks]
+            # Let every worker finish with fd before the finally below closes it
+            wait(futures)
+            return [future.result() for future in futures]
+        except OSError as e:
+            raise ChecksumError(f"Error reading file {file_path}: {e}") from e
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _advise_willneed(fd: int, chunks: list[ChunkInfo]):
+        """Ask the kernel to start reading every chunk range of the batch ahead of the workers."""
+        if not hasattr(os, "posix_fadvise"):
+            return
+        try:
+            for chunk in chunks:
+                os.posix_fadvise(fd, chunk.offset, chunk.size, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            # Purely a hint; some filesystems reject it
+            pass
+
+    def _hash_range(self, fd: int, offset: int, size: int) -> str:
+        """Hash size bytes of an open file starting at offset (stops early at EOF)."""
+        hasher = self._get_hasher()
+        end = offset + size
+        while offset < end:
+            data = os.pread(fd, min(self.buffer_size, end - offset), offset)
+            if not data:
+                break
+            hasher.update(data)
+            offset += len(data)
+        return hasher.hexdigest()
 
 
 class RemoteChecksumGenerator(ChecksumGenerator):
@@ -168,6 +248,8 @@ class RemoteChecksumGenerator(ChecksumGenerator):
             return "sha1sum"
         elif self.algorithm == ValidationAlgorithm.XXH128:
             return "xxh128sum"
+        elif self.algorithm == ValidationAlgorithm.BLAKE3:
+            return "b3sum"
         else:
             raise ChecksumError(f"Unsupported algorithm: {self.algorithm}")
 
@@ -179,7 +261,8 @@ class RemoteChecksumGenerator(ChecksumGenerator):
             # Handle output format: "checksum  filename"
             parts = decoded.split()
             if len(parts) >= 1:
-                return parts[0]
+                # hexdigest() is lowercase; normalise tools that print uppercase
+                return parts[0].lower()
             raise ChecksumError(f"Unexpected checksum output format: {decoded}")
         except UnicodeDecodeError as e:
             raise ChecksumError(f"Failed to decode checksum output: {e}") from e
@@ -294,7 +377,7 @@ class RemoteChecksumGenerator(ChecksumGenerator):
             for line in lines:
                 parts = line.strip().split()
                 if parts:
-                    checksums.append(parts[0])
+                    checksums.append(parts[0].lower())
 
             if len(checksums) != len(chunks):
                 raise ChecksumError(f"Expected {len(chunks)} checksums, got {len(checksums)}")
@@ -58,28 +58,14 @@ class ChunkManager:
         # Ensure chunk size is within bounds
         actual_chunk_size = max(self.config.min_chunk_size, min(actual_chunk_size, self.config.max_chunk_size))
 
-        chunks = []
-        offset = 0
-        index = 0
-
-        while offset < file_size:
-            # Calculate chunk size (last chunk may be smaller)
-            remaining = file_size - offset
-            size = min(actual_chunk_size, remaining)
-
-            chunk = ChunkInfo(index=index, offset=offset, size=size, status=ChunkStatus.PENDING)
-            chunks.append(chunk)
-
-            offset += size
-            index += 1
-
-        validation_info = FileValidationInfo(
-            file_path=file_path, file_size=file_size, algorithm=self.config.algorithm, chunks=chunks
+        validation_info = FileValidationInfo.from_layout(
+            file_path, file_size, actual_chunk_size, algorithm=self.config.algorithm
         )
 
         self._file_validations[file_path] = validation_info
         self.logger.debug(
-            f"Created {len(chunks)} chunks for {file_path} (size={file_size}, chunk_size={actual_chunk_size})"
+            f"Created {validation_info.total_chunks} chunks for {file_path} "
+            f"(size={file_size}, chunk_size={actual_chunk_size})"
         )
 
         return validation_info
@@ -153,7 +139,7 @@ class ChunkManager:
         if chunk.local_checksum is None or chunk.remote_checksum is None:
             return None
 
-        chunk.status = ChunkStatus.VALIDATING
+        chunk.mark_validating()
 
         if chunk.local_checksum == chunk.remote_checksum:
             chunk.mark_valid()
@@ -317,7 +303,7 @@ class ChunkManager:
             return None
 
         chunk = info.chunks[chunk_index]
-        chunk.status = ChunkStatus.PENDING
+        chunk.mark_pending()
         chunk.local_checksum = None
 
         return chunk
@@ -19,6 +19,7 @@ from common import (
     AppProcess,
     overrides,
     ValidationConfig,
+    ChunkInfo,
     FileValidationInfo,
     ChunkStatus,
 )
@@ -121,7 +122,9 @@ class ValidationDispatch:
         self._remote_base_path = remote_base_path
 
         # Initialize components
-        self._local_checksum = LocalChecksumGenerator(algorithm=config.algorithm)
+        self._local_checksum = LocalChecksumGenerator(
+            algorithm=config.algorithm, workers=config.parallel_validation or os.cpu_count() or 1
+        )
         self._remote_checksum = RemoteChecksumGenerator(sshcp, algorithm=config.algorithm)
         self._chunk_manager = ChunkManager(config)
         self._adaptive_sizer = AdaptiveChunkSizer(config)
@@ -143,6 +146,10 @@ class ValidationDispatch:
         self._chunk_manager.set_base_logger(base_logger)
         self._adaptive_sizer.set_base_logger(base_logger)
 
+    def close(self):
+        """Release the checksum worker threads."""
+        self._local_checksum.close()
+
     def queue_validation(self, command: ValidationCommand):
         """Queue a file for validation."""
         if command.inline:
@@ -175,6 +182,22 @@ class ValidationDispatch:
 
         return None
 
+    def _next_chunk_batch(self, pending_chunks: list[ChunkInfo]) -> list[ChunkInfo]:
+        """
+        Pick the pending chunks to hash in this tick.
+
+        Takes up to one chunk per checksum worker. The workers hash in parallel,
+        so a tick takes about as long as its largest chunk, not the batch total.
+        """
+        return pending_chunks[: self._local_checksum.workers]
+
+    def _try_chunk_checksum(self, local_path: str, chunk: ChunkInfo) -> Optional[str]:
+        """Hash a single chunk, returning None if it can't be read."""
+        try:
+            return self._local_checksum.compute_chunk_checksum(local_path, chunk.offset, chunk.size)
+        except ChecksumError:
+            return None
+
     def _start_validation(self, command: ValidationCommand) -> Optional[ValidationCompletedResult]:
         """Start validation for a new file."""
         local_path = os.path.join(self._local_base_path, command.local_path)
@@ -271,19 +294,25 @@ class ValidationDispatch:
             pending_chunks = [c for c in pending_chunks if c.end_offset <= current_local_size]
 
         if pending_chunks:
-            # Validate next pending chunk
-            chunk = pending_chunks[0]
+            # Validate the next pending chunks, one per checksum worker
+            batch = self._next_chunk_batch(pending_chunks)
             try:
-                local_checksum = self._local_checksum.compute_chunk_checksum(local_path, chunk.offset, chunk.size)
+                local_checksums = self._local_checksum.compute_chunk_checksums(local_path, batch)
+            except ChecksumError:
+                # Retry one chunk at a time so only the unreadable chunks are marked corrupt
+                local_checksums = [self._try_chunk_checksum(local_path, chunk) for chunk in batch]
+
+            for chunk, local_checksum in zip(batch, local_checksums):
+                if local_checksum is None:
+                    # Mark chunk as corrupt if we can't read it
+                    validation_info.chunks[chunk.index].mark_corrupt()
+                    continue
                 self._chunk_manager.update_chunk_checksum(local_path, chunk.index, local_checksum=local_checksum)
                 self._chunk_manager.validate_chunk(local_path, chunk.index)
 
                 # Update adaptive sizer with result
                 chunk_info = validation_info.chunks[chunk.index]
                 self._adaptive_sizer.update_network_stats(chunk_success=(chunk_info.status == ChunkStatus.VALID))
-            except ChecksumError:
-                # Mark chunk as corrupt if we can't read it
-                validation_info.chunks[chunk.index].mark_corrupt()
 
             return None
 
@@ -451,6 +480,8 @@ class ValidationProcess(AppProcess):
     def run_cleanup(self):
         """Cleanup when process exits."""
         self.logger.info("Validation process shutting down")
+        if self._dispatch is not None:
+            self._dispatch.close()
 
     @overrides(AppProcess)
     def run_loop(self):
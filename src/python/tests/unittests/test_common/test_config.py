@@ -1,5 +1,6 @@
 # Copyright 2017, Inderpreet Singh, All rights reserved.
 
+import configparser
 import json
 import unittest
 import os
@@ -9,6 +10,15 @@ from common import Config, ConfigError, PersistError, PathMapping
 from common.config import InnerConfig, Checkers, Converters
 
 
+def _from_str_configparser(content: str) -> Config:
+    """Reference parse with configparser, to check the minimal reader in Config.from_str against"""
+    config_parser = configparser.RawConfigParser(interpolation=None)
+    config_parser.read_string(content)
+    return Config.from_dict(
+        {section: dict(config_parser.items(section, raw=True)) for section in config_parser.sections()}
+    )
+
+
 class TestConverters(unittest.TestCase):
     def test_int(self):
         self.assertEqual(0, Converters.int(None, "", "0"))
@@ -35,6 +45,10 @@ class TestConverters(unittest.TestCase):
         self.assertEqual(False, Converters.bool(None, "", "FALSE"))
         self.assertEqual(True, Converters.bool(None, "", "1"))
         self.assertEqual(False, Converters.bool(None, "", "0"))
+        self.assertEqual(True, Converters.bool(None, "", "yes"))
+        self.assertEqual(False, Converters.bool(None, "", "No"))
+        self.assertEqual(True, Converters.bool(None, "", "On"))
+        self.assertEqual(False, Converters.bool(None, "", "off"))
         with self.assertRaises(ConfigError) as e:
             Converters.bool(TestConverters, "bad", "")
         self.assertEqual("Bad config: TestConverters.bad is empty", str(e.exception))
@@ -71,6 +85,14 @@ class TestInnerConfig(unittest.TestCase):
         dummy_config = DummyInnerConfig()
         self.assertEqual(["c_prop1", "a_prop2", "b_prop3"], list(dummy_config.as_dict().keys()))
 
+    def test_as_dict_reflects_changes(self):
+        dummy_config = DummyInnerConfig()
+        self.assertEqual({"c_prop1": "1", "a_prop2": "2", "b_prop3": "3"}, dummy_config.as_dict())
+        dummy_config.a_prop2 = "two"
+        self.assertEqual({"c_prop1": "1", "a_prop2": "two", "b_prop3": "3"}, dummy_config.as_dict())
+        dummy_config.as_dict()["b_prop3"] = "three"
+        self.assertEqual("3", dummy_config.as_dict()["b_prop3"])
+
     def test_has_property(self):
         dummy_config = DummyInnerConfig()
         self.assertTrue(dummy_config.has_property("c_prop1"))
@@ -97,6 +119,49 @@ class TestInnerConfig(unittest.TestCase):
 
 
 class TestConfig(unittest.TestCase):
+    COMPLETE_CONFIG_STR = """
+        [General]
+        debug=False
+        verbose=False
+
+        [Lftp]
+        remote_address=remote.server.com
+        remote_username=remote-user
+        remote_password=pa%ss%%word
+        remote_port=22
+        remote_path=/path/on/remote/server
+        local_path=/path/on/local/server
+        remote_path_to_scan_script=/path/on/remote/server/to/scan/script
+        use_ssh_key=False
+        num_max_parallel_downloads=2
+        num_max_parallel_files_per_download=3
+        num_max_connections_per_root_file=4
+        num_max_connections_per_dir_file=5
+        num_max_total_connections=7
+        use_temp_file=False
+
+        [Controller]
+        interval_ms_remote_scan=30000
+        interval_ms_local_scan=10000
+        interval_ms_downloading_scan=2000
+        extract_path=/path/where/to/extract/stuff
+        use_local_path_as_extract_path=False
+        enable_download_validation=False
+        download_validation_max_retries=3
+        use_chunked_validation=False
+        validation_chunk_size_mb=4
+        enable_disk_space_check=False
+        disk_space_min_percent=10
+
+        [Web]
+        port=88
+
+        [AutoQueue]
+        enabled=False
+        patterns_only=False
+        auto_extract=False
+        """
+
     def __check_unknown_error(self, cls, good_dict):
         """
         Helper method to check that a config class raises an error on
@@ -415,6 +480,12 @@ class TestConfig(unittest.TestCase):
         self.assertEqual("/new/remote", mappings[0].remote_path)
         self.assertEqual("/new/local", mappings[0].local_path)
 
+        # Test mappings_json set directly is picked up
+        config.pathmappings.mappings_json = json.dumps([
+            {"remote_path": "/direct/remote", "local_path": "/direct/local"},
+        ])
+        self.assertEqual([PathMapping("/direct/remote", "/direct/local")], config.get_path_mappings())
+
         # Test empty mappings
         config.set_path_mappings([])
         self.assertEqual(0, len(config.get_path_mappings()))
@@ -460,6 +531,9 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(1, len(mappings))
         self.assertEqual("/data/files", mappings[0].remote_path)
         self.assertEqual("/downloads/files", mappings[0].local_path)
+        self.assertEqual(
+            '[{"remote_path":"/data/files","local_path":"/downloads/files"}]', config.pathmappings.mappings_json
+        )
 
     def test_from_file(self):
         # Create empty config file
@@ -652,7 +726,7 @@ class TestConfig(unittest.TestCase):
         auto_extract = False
 
         [PathMappings]
-        mappings_json = [{"remote_path": "/remote/server/path", "local_path": "/local/server/path"}]
+        mappings_json = [{"remote_path":"/remote/server/path","local_path":"/local/server/path"}]
         """
 
         golden_lines = [s.strip() for s in golden_str.splitlines()]
@@ -664,6 +738,45 @@ class TestConfig(unittest.TestCase):
         for i, _ in enumerate(golden_lines):
             self.assertEqual(golden_lines[i], actual_lines[i])
 
+    def test_percent_in_value_round_trips(self):
+        content = TestConfig.COMPLETE_CONFIG_STR
+        config = Config.from_str(content)
+        self.assertEqual("pa%ss%%word", config.lftp.remote_password)
+        config = Config.from_str(config.to_str())
+        self.assertEqual("pa%ss%%word", config.lftp.remote_password)
+
+    def test_from_str_returns_independent_configs(self):
+        content = TestConfig.COMPLETE_CONFIG_STR
+        config1 = Config.from_str(content)
+        config1.lftp.remote_port = 2222
+        config2 = Config.from_str(content)
+        self.assertEqual(22, config2.lftp.remote_port)
+        self.assertIsNot(config1.lftp, config2.lftp)
+
+    def test_from_str_matches_configparser(self):
+        contents = [
+            TestConfig.COMPLETE_CONFIG_STR,
+            Config.from_str(TestConfig.COMPLETE_CONFIG_STR).to_str(),
+            TestConfig.COMPLETE_CONFIG_STR.replace(
+                "remote_port=22", "# comment\n        ; comment\n        Remote_Port : 22"
+            ),
+        ]
+        for content in contents:
+            self.assertEqual(
+                _from_str_configparser(content).as_dict(),
+                Config.from_str(content).as_dict()
+            )
+
+    def test_multiline_value_round_trips(self):
+        config = Config.from_str(TestConfig.COMPLETE_CONFIG_STR)
+        config.lftp.remote_password = "a\nb\n\nc"
+        content = config.to_str()
+        self.assertEqual("a\nb\n\nc", Config.from_str(content).lftp.remote_password)
+        self.assertEqual(
+            _from_str_configparser(content).as_dict(),
+            Config.from_str(content).as_dict()
+        )
+
     def test_persist_read_error(self):
         # bad section
         content = """
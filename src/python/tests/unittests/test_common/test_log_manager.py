@@ -0,0 +1,278 @@
+# Copyright 2017, Inderpreet Singh, All rights reserved.
+
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+from common import log_manager
+from common.log_manager import (
+    BackgroundLogHandler, FastRotatingFileHandler, JsonFormatter, LogManager, log_with_context
+)
+
+
+class TestBackgroundLogHandler(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="test_log_manager")
+        self.log_path = os.path.join(self.temp_dir, "test.log")
+        self.handler = BackgroundLogHandler(
+            FastRotatingFileHandler(self.log_path, autoflush=False, buffer_size=64 * 1024)
+        )
+        self.handler.setFormatter(logging.Formatter("%(message)s"))
+
+    def tearDown(self):
+        self.handler.close()
+        shutil.rmtree(self.temp_dir)
+
+    def _read_log(self) -> list[str]:
+        with open(self.log_path) as f:
+            return f.read().splitlines()
+
+    @staticmethod
+    def _record(msg: str, *args) -> logging.LogRecord:
+        return logging.makeLogRecord({"msg": msg, "args": args or None})
+
+    def test_writer_starts_on_first_record(self):
+        self.assertIsNone(self.handler._thread)
+        self.handler.handle(self._record("first"))
+        self.assertTrue(self.handler._thread.is_alive())
+
+    def test_flush_writes_queued_records(self):
+        for i in range(1000):
+            self.handler.handle(self._record("line %d", i))
+        self.handler.flush()
+        self.assertEqual([f"line {i}" for i in range(1000)], self._read_log())
+
+    def test_writer_flushes_once_per_batch(self):
+        release = threading.Event()
+        target = MagicMock()
+        target.handle.side_effect = lambda _record: release.wait()
+        handler = BackgroundLogHandler(target)
+        self.addCleanup(handler.close)
+        # The writer blocks on the first record while the rest queue up behind it
+        for i in range(100):
+            handler.handle(self._record("line %d", i))
+        release.set()
+        handler.flush()
+        self.assertEqual(100, target.handle.call_count)
+        self.assertLessEqual(target.flush.call_count, 4)
+
+    def test_flush_without_records(self):
+        self.handler.flush()
+        self.assertIsNone(self.handler._thread)
+
+    def test_record_not_modified(self):
+        record = self._record("a %s", "b")
+        self.handler.handle(record)
+        self.assertEqual("a %s", record.msg)
+        self.assertEqual(("b",), record.args)
+
+    def test_args_merged_at_emit(self):
+        values = ["before"]
+        self.handler.handle(self._record("value %s", values))
+        values[0] = "after"
+        self.handler.flush()
+        self.assertEqual(["value ['before']"], self._read_log())
+
+    def test_close_stops_writer(self):
+        self.handler.handle(self._record("last"))
+        thread = self.handler._thread
+        self.handler.close()
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(self.handler.target.stream)
+        self.assertEqual(["last"], self._read_log())
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_forked_child_does_not_rewrite_parent_buffer(self):
+        self.handler.handle(self._record("parent"))
+        self.handler.flush()
+        # Leave bytes in the parent's buffer across the fork
+        self.handler.target.stream.write("unflushed\n")
+        pid = os.fork()
+        if pid == 0:
+            try:
+                self.handler.handle(self._record("child"))
+            finally:
+                os._exit(0)
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(0, status)
+        self.handler.flush()
+        self.assertEqual(["parent", "child", "unflushed"], self._read_log())
+
+
+def _json_record(msg: str = "message", **attrs) -> logging.LogRecord:
+    record = logging.LogRecord("test.logger", logging.INFO, "/path/file.py", 42, msg, None, None, func="func")
+    record.created = 1700000000.25
+    record.__dict__.update(attrs)
+    return record
+
+
+class TestJsonFormatter(unittest.TestCase):
+    @unittest.skipIf(log_manager.orjson is None, "orjson not installed")
+    def test_orjson_matches_stdlib(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            exc_info = sys.exc_info()
+        records = [
+            _json_record(),
+            _json_record('quote " and \u00e9', extra_data={"n": 1, "nested": {"a": [1, 2]}, 3: None}),
+            _json_record("with exception", exc_info=exc_info),
+            _json_record("datetimes", extra_data={"at": datetime(2024, 1, 2, 3, 4, 5), "on": date(2024, 1, 2)}),
+            _json_record("big int", extra_data={"n": 2**70, "neg": -(2**64)}),
+        ]
+        formatter = JsonFormatter()
+        for record in records:
+            with_orjson = formatter.format(record)
+            with patch.object(log_manager, "orjson", None):
+                without_orjson = formatter.format(record)
+            self.assertEqual(json.loads(without_orjson), json.loads(with_orjson))
+
+    def test_naive_datetime_written_as_str(self):
+        output = JsonFormatter().format(_json_record(extra_data={"at": datetime(2024, 1, 2, 3, 4, 5, 600)}))
+        self.assertEqual({"at": "2024-01-02 03:04:05.000600"}, json.loads(output)["extra"])
+
+    def test_int_wider_than_64_bits_is_not_dropped(self):
+        output = JsonFormatter().format(_json_record(extra_data={"n": 2**70}))
+        self.assertEqual({"n": 2**70}, json.loads(output)["extra"])
+
+    def test_template_matches_dict_layout(self):
+        record = _json_record('quote " backslash \\ newline \n unicode é', processName=None)
+        with patch.object(log_manager, "orjson", None):
+            output = JsonFormatter().format(record)
+        self.assertEqual(
+            {
+                "timestamp": "2023-11-14T22:13:20.250000Z",
+                "level": "INFO",
+                "logger": "test.logger",
+                "message": 'quote " backslash \\ newline \n unicode é',
+                "process": {"name": None, "id": record.process},
+                "thread": {"name": record.threadName, "id": record.thread},
+                "source": {"file": "file.py", "line": 42, "function": "func"},
+            },
+            json.loads(output),
+        )
+
+    def test_timestamp_cache(self):
+        with patch.object(JsonFormatter, "_ts_cache", (-1, "")):
+            self.assertEqual("2023-11-14T22:13:20.500000Z", JsonFormatter._timestamp(1700000000.5))
+            self.assertEqual((1700000000, "2023-11-14T22:13:20"), JsonFormatter._ts_cache)
+            # Same second reuses the cached part
+            self.assertEqual("2023-11-14T22:13:20.125000Z", JsonFormatter._timestamp(1700000000.125))
+            self.assertEqual("2023-11-14T22:13:21.000000Z", JsonFormatter._timestamp(1700000001.0))
+            self.assertEqual((1700000001, "2023-11-14T22:13:21"), JsonFormatter._ts_cache)
+            # Going back in time is not served from the cache
+            self.assertEqual("2023-11-14T22:13:20.250000Z", JsonFormatter._timestamp(1700000000.25))
+
+
+class TestLogWithContext(unittest.TestCase):
+    def test_disabled_level_skipped(self):
+        logger = MagicMock()
+        logger.isEnabledFor.return_value = False
+        log_with_context(logger, logging.DEBUG, "message", key="value")
+        logger.isEnabledFor.assert_called_once_with(logging.DEBUG)
+        logger.log.assert_not_called()
+
+    def test_enabled_level_logged(self):
+        logger = MagicMock()
+        logger.isEnabledFor.return_value = True
+        log_with_context(logger, logging.INFO, "message", key="value")
+        logger.log.assert_called_once_with(logging.INFO, "message", extra={"extra_data": {"key": "value"}})
+        log_with_context(logger, logging.INFO, "plain")
+        logger.log.assert_called_with(logging.INFO, "plain", extra={})
+
+
+class TestFastRotatingFileHandler(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="test_log_manager")
+        self.log_path = os.path.join(self.temp_dir, "test.log")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _handler(self, max_bytes: int) -> FastRotatingFileHandler:
+        handler = FastRotatingFileHandler(self.log_path, maxBytes=max_bytes, backupCount=2)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self.addCleanup(handler.close)
+        return handler
+
+    @staticmethod
+    def _record(msg: str) -> logging.LogRecord:
+        return logging.makeLogRecord({"msg": msg})
+
+    def test_size_counted_from_existing_file(self):
+        with open(self.log_path, "w") as f:
+            f.write("x" * 100)
+        self.assertEqual(100, self._handler(max_bytes=1000)._bytes_written)
+
+    def test_rollover_when_count_reaches_max_bytes(self):
+        handler = self._handler(max_bytes=30)
+        for _ in range(3):
+            handler.handle(self._record("123456789"))  # 10 bytes with the newline
+        self.assertEqual(30, handler._bytes_written)
+        self.assertFalse(os.path.exists(self.log_path + ".1"))
+        # The next record rolls over first and starts the count again
+        handler.handle(self._record("abc"))
+        self.assertEqual(4, handler._bytes_written)
+        with open(self.log_path + ".1") as f:
+            self.assertEqual("123456789\n" * 3, f.read())
+        with open(self.log_path) as f:
+            self.assertEqual("abc\n", f.read())
+
+    def test_no_rollover_without_max_bytes(self):
+        handler = self._handler(max_bytes=0)
+        for _ in range(100):
+            handler.handle(self._record("123456789"))
+        self.assertEqual(1000, handler._bytes_written)
+        self.assertFalse(os.path.exists(self.log_path + ".1"))
+
+    def test_reconcile_picks_up_external_writes(self):
+        handler = self._handler(max_bytes=0)
+        handler.handle(self._record("first"))
+        with open(self.log_path, "a") as f:
+            f.write("y" * 500)
+        with patch.object(FastRotatingFileHandler, "RECONCILE_INTERVAL", 3):
+            handler.handle(self._record("second"))
+            self.assertEqual(13, handler._bytes_written)
+            # The third record reconciles with the real size before it is counted
+            handler.handle(self._record("third"))
+        self.assertEqual(6 + 500 + 7 + 6, handler._bytes_written)
+        self.assertEqual(os.path.getsize(self.log_path), handler._bytes_written)
+
+
+class TestLogManagerCreateLogger(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="test_log_manager")
+        self.name = f"{TestLogManagerCreateLogger.__name__}.{self._testMethodName}"
+
+    def tearDown(self):
+        LogManager._clear_handlers(logging.getLogger(self.name))
+        LogManager._configured.pop(self.name, None)
+        shutil.rmtree(self.temp_dir)
+
+    def test_unchanged_config_reuses_handler(self):
+        logger = LogManager.create_logger(self.name, level=logging.INFO, log_dir=self.temp_dir)
+        handler = logger.handlers[0]
+        self.assertIsInstance(handler, BackgroundLogHandler)
+        self.assertIs(logger, LogManager.create_logger(self.name, level=logging.INFO, log_dir=self.temp_dir))
+        self.assertEqual([handler], logger.handlers)
+
+    def test_changed_config_replaces_handler(self):
+        logger = LogManager.create_logger(self.name, level=logging.INFO, log_dir=self.temp_dir)
+        handler = logger.handlers[0]
+        LogManager.create_logger(self.name, level=logging.DEBUG, log_dir=self.temp_dir)
+        self.assertEqual(1, len(logger.handlers))
+        self.assertIsNot(handler, logger.handlers[0])
+        self.assertEqual(logging.DEBUG, logger.level)
+
+    def test_removed_handlers_are_recreated(self):
+        logger = LogManager.create_logger(self.name, level=logging.INFO, log_dir=self.temp_dir)
+        LogManager._clear_handlers(logger)
+        LogManager.create_logger(self.name, level=logging.INFO, log_dir=self.temp_dir)
+        self.assertEqual(1, len(logger.handlers))
@@ -0,0 +1,381 @@
+# Copyright 2025, RapidCopy Contributors, All rights reserved.
+
+import errno
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from common import mount_utils
+from common.mount_utils import MountResult, MNT_FORCE, MS_BIND
+from common.network_mount import NetworkMount, MountType, MountStatus
+
+
+def _completed(returncode: int = 0, stderr: bytes = b"") -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=b"", stderr=stderr)
+
+
+class TestLocalMountSyscalls(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="test_mount_utils")
+        self.source = os.path.join(self.temp_dir, "source")
+        os.mkdir(self.source)
+        base_patcher = patch("common.network_mount.MOUNTS_BASE_DIR", os.path.join(self.temp_dir, "mounts"))
+        base_patcher.start()
+        self.addCleanup(base_patcher.stop)
+        self.mount = NetworkMount(name="local", mount_type=MountType.LOCAL.value, share_path=self.source)
+
+        self.libc = MagicMock()
+        self.libc.mount.return_value = 0
+        self.libc.umount2.return_value = 0
+        libc_patcher = patch("common.mount_utils._get_libc", return_value=self.libc)
+        self.get_libc = libc_patcher.start()
+        self.addCleanup(libc_patcher.stop)
+        run_patcher = patch("common.mount_utils.subprocess.run", return_value=_completed())
+        self.run = run_patcher.start()
+        self.addCleanup(run_patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _fail_syscalls(self, err: int):
+        self.libc.mount.return_value = -1
+        self.libc.umount2.return_value = -1
+        patcher = patch("common.mount_utils.ctypes.get_errno", return_value=err)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_mount_success(self):
+        result = mount_utils.mount_local(self.mount)
+        self.assertEqual(MountResult.SUCCESS, result.result)
+        self.assertEqual((0, 0), (result.exit_code, result.os_errno))
+        args = self.libc.mount.call_args.args
+        self.assertEqual(os.fsencode(self.source), args[0])
+        self.assertEqual(os.fsencode(self.mount.mount_point), args[1])
+        self.assertEqual(MS_BIND, args[3].value)
+        self.run.assert_not_called()
+
+    def test_mount_falls_back_to_mount_binary(self):
+        for err in (errno.EPERM, errno.ENOSYS):
+            with self.subTest(err=err):
+                self._fail_syscalls(err)
+                self.run.reset_mock()
+                result = mount_utils.mount_local(self.mount)
+                self.assertEqual(MountResult.SUCCESS, result.result)
+                self.assertEqual(["mount", "--bind", self.source, self.mount.mount_point], self.run.call_args.args[0])
+
+    def test_mount_errno_mapping(self):
+        for err, expected in (
+            (errno.ENOENT, MountResult.NOT_FOUND),
+            (errno.EACCES, MountResult.PERMISSION_DENIED),
+            (errno.EBUSY, MountResult.ERROR),
+        ):
+            with self.subTest(err=err):
+                self._fail_syscalls(err)
+                result = mount_utils.mount_local(self.mount)
+                self.assertEqual(expected, result.result)
+                self.assertEqual(os.strerror(err), result.message)
+                self.assertEqual((0, err), (result.exit_code, result.os_errno))
+        self.run.assert_not_called()
+
+    def test_mount_without_libc(self):
+        self.get_libc.return_value = None
+        self.run.return_value = _completed(32, b"mount: failed")
+        result = mount_utils.mount_local(self.mount)
+        self.assertEqual(MountResult.ERROR, result.result)
+        self.assertEqual((32, 0), (result.exit_code, result.os_errno))
+        self.assertEqual("mount: failed", result.message)
+
+    def test_mount_with_options_uses_mount_binary(self):
+        self.mount.mount_options = "ro"
+        result = mount_utils.mount_local(self.mount)
+        self.assertEqual(MountResult.SUCCESS, result.result)
+        self.libc.mount.assert_not_called()
+        self.assertEqual(
+            ["mount", "--bind", "-o", "ro", self.source, self.mount.mount_point], self.run.call_args.args[0]
+        )
+
+    @patch("common.mount_utils.is_mounted", return_value=True)
+    def test_unmount_success(self, _):
+        result = mount_utils.do_unmount(self.mount, force=True)
+        self.assertEqual(MountResult.SUCCESS, result.result)
+        self.libc.umount2.assert_called_once_with(os.fsencode(self.mount.mount_point), MNT_FORCE)
+        self.run.assert_not_called()
+
+    @patch("common.mount_utils.is_mounted", return_value=True)
+    def test_unmount_busy(self, _):
+        self._fail_syscalls(errno.EBUSY)
+        result = mount_utils.do_unmount(self.mount)
+        self.assertEqual(MountResult.ERROR, result.result)
+        self.assertIn("busy", result.message)
+        self.assertEqual((0, errno.EBUSY), (result.exit_code, result.os_errno))
+        self.run.assert_not_called()
+
+    @patch("common.mount_utils.is_mounted", return_value=True)
+    def test_unmount_falls_back_to_umount_binary(self, _):
+        self._fail_syscalls(errno.EPERM)
+        result = mount_utils.do_unmount(self.mount)
+        self.assertEqual(MountResult.SUCCESS, result.result)
+        self.assertEqual(["umount", self.mount.mount_point], self.run.call_args.args[0])
+
+    @patch("common.mount_utils.is_mounted", return_value=True)
+    def test_unmount_without_libc(self, _):
+        self.get_libc.return_value = None
+        result = mount_utils.do_unmount(self.mount, force=True)
+        self.assertEqual(MountResult.SUCCESS, result.result)
+        self.assertEqual(["umount", "-f", self.mount.mount_point], self.run.call_args.args[0])
+
+
+class TestClassifyMountError(unittest.TestCase):
+    def test_phrases(self):
+        self.assertEqual(MountResult.PERMISSION_DENIED, mount_utils._classify_mount_error("Permission denied"))
+        self.assertEqual(
+            MountResult.PERMISSION_DENIED, mount_utils._classify_mount_error("access denied by server while mounting")
+        )
+        self.assertEqual(MountResult.NOT_FOUND, mount_utils._classify_mount_error("No such file or directory"))
+        self.assertEqual(MountResult.NOT_FOUND, mount_utils._classify_mount_error("mount.nfs: share not found"))
+        self.assertEqual(MountResult.ERROR, mount_utils._classify_mount_error("Connection timed out"))
+
+    def test_priority_does_not_depend_on_position(self):
+        self.assertEqual(
+            MountResult.PERMISSION_DENIED,
+            mount_utils._classify_mount_error("mount error(16): Device or resource busy; Permission denied"),
+        )
+        self.assertEqual(
+            MountResult.PERMISSION_DENIED, mount_utils._classify_mount_error("not found, then permission denied")
+        )
+
+    def test_busy_is_not_a_mount_result(self):
+        self.assertEqual(MountResult.ERROR, mount_utils._classify_mount_error("Device or resource busy"))
+
+
+class TestMountTable(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="test_mount_utils")
+        self.mounts_file = os.path.join(self.temp_dir, "mounts")
+        patcher = patch("common.mount_utils.PROC_MOUNTS", self.mounts_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write_mounts(self, *targets: str):
+        with open(self.mounts_file, "w") as f:
+            for target in targets:
+                f.write(f"/dev/sda1 {target} ext4 rw,relatime 0 0\n")
+
+    def test_unescape_mount_path(self):
+        self.assertEqual("/plain/path", mount_utils._unescape_mount_path("/plain/path"))
+        self.assertEqual("/a b\tc\nd\\e", mount_utils._unescape_mount_path("/a\\040b\\011c\\012d\\134e"))
+        # An escaped backslash followed by digits is not decoded a second time
+        self.assertEqual("/x\\040", mount_utils._unescape_mount_path("/x\\134040"))
+
+    def test_read_mount_targets(self):
+        self._write_mounts("/", "/mnt/with\\040space", "/mnt/back\\134slash")
+        with open(self.mounts_file, "a") as f:
+            f.write("malformed\n")
+        self.assertEqual({"/", "/mnt/with space", "/mnt/back\\slash"}, mount_utils.read_mount_targets())
+
+    def test_read_mount_targets_missing_file(self):
+        self.assertEqual(set(), mount_utils.read_mount_targets())
+
+    def test_is_mounted_missing_path(self):
+        self._write_mounts(os.path.join(self.temp_dir, "missing"))
+        self.assertFalse(mount_utils.is_mounted(os.path.join(self.temp_dir, "missing")))
+
+    def test_is_mounted_from_mount_table(self):
+        # A bind mount from the same filesystem is only visible in the mount table
+        target = os.path.join(self.temp_dir, "bind target")
+        os.mkdir(target)
+        self.assertFalse(mount_utils.is_mounted(target))
+        self._write_mounts(os.path.realpath(target).replace(" ", "\\040"))
+        self.assertTrue(mount_utils.is_mounted(target))
+
+    def test_is_mounted_uses_given_targets(self):
+        target = os.path.join(self.temp_dir, "target")
+        os.mkdir(target)
+        self._write_mounts(os.path.realpath(target))
+        self.assertFalse(mount_utils.is_mounted(target, mount_targets=set()))
+        self.assertTrue(mount_utils.is_mounted(target, mount_targets={os.path.realpath(target)}))
+
+    def test_is_mounted_mount_point(self):
+        self.assertTrue(mount_utils.is_mounted("/"))
+
+
+class TestMountStatuses(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="test_mount_utils")
+        self.mounts_dir = os.path.join(self.temp_dir, "mounts")
+        os.mkdir(self.mounts_dir)
+        self.mounts_file = os.path.join(self.temp_dir, "proc_mounts")
+        for target, value in (
+            ("common.network_mount.MOUNTS_BASE_DIR", self.mounts_dir),
+            ("common.mount_utils.PROC_MOUNTS", self.mounts_file),
+        ):
+            patcher = patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _mount(self, mount_id: str, create: bool = True) -> NetworkMount:
+        mount = NetworkMount(name=mount_id, mount_type=MountType.NFS.value, server="server", id=mount_id)
+        if create:
+            os.mkdir(mount.mount_point)
+        return mount
+
+    def test_statuses_in_order(self):
+        mounted = self._mount("mounted")
+        missing = self._mount("missing", create=False)
+        unmounted = self._mount("unmounted")
+        with open(self.mounts_file, "w") as f:
+            f.write(f"server:/share {os.path.realpath(mounted.mount_point)} nfs rw 0 0\n")
+
+        with patch("common.mount_utils.read_mount_targets", wraps=mount_utils.read_mount_targets) as read_targets:
+            statuses = mount_utils.get_mount_statuses([mounted, missing, unmounted])
+        read_targets.assert_called_once_with()
+        self.assertEqual(
+            [
+                (MountStatus.MOUNTED, "Mounted and accessible"),
+                (MountStatus.UNMOUNTED, "Mount point does not exist"),
+                (MountStatus.UNMOUNTED, "Not mounted"),
+            ],
+            statuses,
+        )
+
+    def test_statuses_keep_order_when_completing_out_of_order(self):
+        mounts = [self._mount(f"mount{i}") for i in range(4)]
+        first_done = threading.Event()
+
+        def get_status(mount, _targets):
+            # The first mount finishes last
+            if mount is mounts[0]:
+                first_done.wait(5)
+            elif mount is mounts[-1]:
+                first_done.set()
+            return MountStatus.MOUNTED, mount.id
+
+        with patch("common.mount_utils.get_mount_status", side_effect=get_status):
+            statuses = mount_utils.get_mount_statuses(mounts)
+        self.assertEqual([(MountStatus.MOUNTED, m.id) for m in mounts], statuses)
+
+    def test_statuses_empty_and_single(self):
+        self.assertEqual([], mount_utils.get_mount_statuses([]))
+        self.assertEqual(
+            [(MountStatus.UNMOUNTED, "Not mounted")], mount_utils.get_mount_statuses([self._mount("one")])
+        )
+
+
+class TestConnections(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="test_mount_utils")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    @staticmethod
+    def _connect(address, timeout):
+        host, _port = address
+        if host == "refused":
+            raise ConnectionRefusedError()
+        if host == "unknown":
+            raise socket.gaierror()
+        if host == "slow":
+            raise socket.timeout()
+        return MagicMock()
+
+    def test_results_in_order(self):
+        mounts = [
+            NetworkMount(name="nfs", mount_type=MountType.NFS.value, server="ok"),
+            NetworkMount(name="cifs", mount_type=MountType.CIFS.value, server="refused"),
+            NetworkMount(name="unknown", mount_type=MountType.NFS.value, server="unknown"),
+            NetworkMount(name="slow", mount_type=MountType.CIFS.value, server="slow"),
+            NetworkMount(name="noserver", mount_type=MountType.NFS.value),
+            NetworkMount(name="local", mount_type=MountType.LOCAL.value, share_path=self.temp_dir),
+            NetworkMount(name="gone", mount_type=MountType.LOCAL.value, share_path=self.temp_dir + "/gone"),
+        ]
+        with patch("common.mount_utils.socket.create_connection", side_effect=self._connect) as connect:
+            results = mount_utils.test_connections(mounts, timeout=3)
+        self.assertEqual(
+            [
+                (True, "Successfully connected to ok:2049"),
+                (False, "Could not connect to refused:445"),
+                (False, "Could not resolve hostname: unknown"),
+                (False, "Connection to slow:445 timed out"),
+                (False, "No server specified"),
+                (True, "Local path exists"),
+                (False, f"Local path does not exist: {self.temp_dir}/gone"),
+            ],
+            results,
+        )
+        self.assertEqual(
+            {(("ok", 2049), 3), (("refused", 445), 3), (("unknown", 2049), 3), (("slow", 445), 3)},
+            {(c.args[0], c.kwargs["timeout"]) for c in connect.call_args_list},
+        )
+
+    def test_results_keep_order_when_completing_out_of_order(self):
+        mounts = [NetworkMount(name=f"m{i}", mount_type=MountType.NFS.value, server=f"host{i}") for i in range(4)]
+        last_done = threading.Event()
+
+        def connect(address, timeout):
+            # The first server answers last
+            if address[0] == "host0":
+                last_done.wait(5)
+                raise ConnectionRefusedError()
+            if address[0] == "host3":
+                last_done.set()
+            return MagicMock()
+
+        with patch("common.mount_utils.socket.create_connection", side_effect=connect):
+            results = mount_utils.test_connections(mounts)
+        self.assertEqual([False, True, True, True], [ok for ok, _ in results])
+        self.assertEqual("Could not connect to host0:2049", results[0][1])
+
+
+class TestMountCifs(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="test_mount_utils")
+        for target, kwargs in (
+            ("common.network_mount.MOUNTS_BASE_DIR", {"new": self.temp_dir}),
+            ("common.mount_utils.is_mounted", {"return_value": False}),
+        ):
+            patcher = patch(target, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        run_patcher = patch("common.mount_utils.subprocess.run", return_value=_completed())
+        self.run = run_patcher.start()
+        self.addCleanup(run_patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_password_passed_in_env(self):
+        mount = NetworkMount(
+            name="share", mount_type=MountType.CIFS.value, server="server", share_path="share", username="user"
+        )
+        logger = MagicMock()
+        logger.isEnabledFor.return_value = True
+        result = mount_utils.mount_cifs(mount, "s3cret,pw", logger)
+        self.assertEqual(MountResult.SUCCESS, result.result)
+
+        cmd = self.run.call_args.args[0]
+        self.assertEqual(["mount", "-t", "cifs", "-o", "username=user", "//server/share", mount.mount_point], cmd)
+        self.assertFalse(any("s3cret" in arg for arg in cmd))
+        env = self.run.call_args.kwargs["env"]
+        self.assertEqual("s3cret,pw", env["PASSWD"])
+        self.assertEqual(os.environ.get("PATH"), env.get("PATH"))
+        logged = [c.args[0] % c.args[1:] for c in logger.debug.call_args_list]
+        self.assertEqual(1, len(logged))
+        self.assertNotIn("s3cret", logged[0])
+
+    def test_guest_mount_has_no_password_env(self):
+        mount = NetworkMount(name="share", mount_type=MountType.CIFS.value, server="server", share_path="share")
+        mount_utils.mount_cifs(mount, "")
+        self.assertIsNone(self.run.call_args.kwargs["env"])
+        self.assertIn("guest", self.run.call_args.args[0])
@@ -0,0 +1,181 @@
+# Copyright 2025, RapidCopy Contributors, All rights reserved.
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from common.network_mount import NetworkMount, NetworkMountCollection, NetworkMountError, NetworkMountManager
+from common.persist import PersistError
+
+
+def _nfs(name: str, **kwargs) -> NetworkMount:
+    return NetworkMount(name=name, mount_type="nfs", server="nas", share_path=f"/{name}", **kwargs)
+
+
+class TestNetworkMountCollection(unittest.TestCase):
+    """Tests for NetworkMountCollection operations."""
+
+    def test_lookup_by_id_follows_mutations(self):
+        """get_mount_by_id should reflect adds, updates, removes and loaded mounts."""
+        first = _nfs("one")
+        collection = NetworkMountCollection(mounts=[first])
+        self.assertIs(first, collection.get_mount_by_id(first.id))
+
+        second = _nfs("two")
+        collection.add_mount(second)
+        with self.assertRaises(NetworkMountError):
+            collection.add_mount(_nfs("other", id=second.id))
+
+        replacement = _nfs("one-new", id=first.id)
+        collection.update_mount(replacement)
+        self.assertIs(replacement, collection.get_mount_by_id(first.id))
+        self.assertEqual([replacement, second], collection.mounts)
+        with self.assertRaises(NetworkMountError):
+            collection.update_mount(_nfs("missing"))
+
+        collection.remove_mount(first.id)
+        self.assertIsNone(collection.get_mount_by_id(first.id))
+        self.assertEqual([second], collection.mounts)
+        with self.assertRaises(NetworkMountError):
+            collection.remove_mount(first.id)
+
+
+    def test_update_and_remove_do_not_compare_mounts(self):
+        """Entries should be located by identity, without calling the dataclass __eq__."""
+        mounts = [_nfs(f"m{i}") for i in range(3)]
+        collection = NetworkMountCollection(mounts=list(mounts))
+        replacement = _nfs("new", id=mounts[2].id)
+        with patch.object(NetworkMount, "__eq__", side_effect=AssertionError("compared")):
+            collection.update_mount(replacement)
+            collection.remove_mount(mounts[1].id)
+        self.assertEqual([mounts[0], replacement], collection.mounts)
+
+class TestNetworkMountManager(unittest.TestCase):
+    """Tests for NetworkMountManager operations and persistence."""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.config_dir = temp_dir.name
+        self.manager = NetworkMountManager(self.config_dir)
+        self.manager.load()
+
+    def test_get_all_mounts_returns_copy(self):
+        """Changing the returned list should not touch the collection or its id index."""
+        mount = _nfs("one")
+        self.manager.add_mount(mount)
+
+        mounts = self.manager.get_all_mounts()
+        mounts.clear()
+        self.assertEqual([mount], self.manager.get_all_mounts())
+        self.assertIs(mount, self.manager.get_mount_by_id(mount.id))
+
+    def test_batch_saves_once(self):
+        """Mutations inside batch() should be written in a single save."""
+        one, two = _nfs("one"), _nfs("two")
+        with patch.object(self.manager, "save", wraps=self.manager.save) as mock_save:
+            with self.manager.batch():
+                self.manager.add_mounts([one, two])
+                self.manager.remove_mount(one.id)
+                self.assertEqual(0, mock_save.call_count)
+            self.assertEqual(1, mock_save.call_count)
+        self.assertEqual([two], NetworkMountManager(self.config_dir).load().mounts)
+
+    def test_batch_does_not_save_when_body_raises(self):
+        """A batch that raises should not persist its partial changes or hide the error."""
+        with patch.object(self.manager, "save", wraps=self.manager.save) as mock_save:
+            with self.assertRaises(RuntimeError):
+                with self.manager.batch():
+                    self.manager.add_mount(_nfs("one"))
+                    raise RuntimeError("boom")
+            self.assertEqual(0, mock_save.call_count)
+        self.assertFalse(os.path.exists(self.manager.file_path))
+
+    def test_add_mounts_is_all_or_nothing(self):
+        """add_mounts should add and save nothing if any mount is rejected."""
+        existing = _nfs("existing")
+        self.manager.add_mount(existing)
+        one = _nfs("one")
+        with patch.object(self.manager, "save", wraps=self.manager.save) as mock_save:
+            with self.assertRaises(NetworkMountError):
+                self.manager.add_mounts([one, NetworkMount(name="bad", mount_type="nfs")])
+            self.assertEqual(0, mock_save.call_count)
+        self.assertEqual([existing], self.manager.get_all_mounts())
+        self.assertIsNone(self.manager.get_mount_by_id(one.id))
+        self.assertEqual([existing], NetworkMountManager(self.config_dir).load().mounts)
+
+
+    def test_unchanged_save_is_skipped(self):
+        """Saving unchanged content should not rewrite the file."""
+        mount = _nfs("one")
+        self.manager.add_mount(mount)
+        with patch("common.network_mount.os.replace", wraps=os.replace) as mock_replace:
+            self.manager.save()
+            self.assertEqual(0, mock_replace.call_count)
+
+            reloaded = NetworkMountManager(self.config_dir)
+            reloaded.load()
+            reloaded.save()
+            self.assertEqual(0, mock_replace.call_count)
+
+            mount.enabled = False
+            self.manager.save()
+            self.assertEqual(1, mock_replace.call_count)
+        self.assertFalse(NetworkMountManager(self.config_dir).load().mounts[0].enabled)
+
+    def test_save_rewrites_deleted_file(self):
+        """A save should not be skipped when the file no longer exists."""
+        self.manager.add_mount(_nfs("one"))
+        os.remove(self.manager.file_path)
+        self.manager.save()
+        self.assertEqual(1, len(NetworkMountManager(self.config_dir).load().mounts))
+
+    def test_save_replaces_file_atomically(self):
+        """A failed save should keep the previous file, and a later save should retry."""
+        mount = _nfs("one")
+        self.manager.add_mount(mount)
+        self.assertEqual(["network_mounts.json"], os.listdir(self.config_dir))
+
+        mount.enabled = False
+        with patch("common.network_mount.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(PersistError):
+                self.manager.save()
+        self.assertTrue(NetworkMountManager(self.config_dir).load().mounts[0].enabled)
+
+        self.manager.save()
+        self.assertFalse(NetworkMountManager(self.config_dir).load().mounts[0].enabled)
+        self.assertEqual(["network_mounts.json"], os.listdir(self.config_dir))
+
+    def test_parse_collection(self):
+        """Full, partial and extended entries should all parse; entries without a name should not."""
+        full = _nfs("full", username="user", domain="dom", mount_options="ro")
+        content = json.dumps(
+            {
+                "version": 2,
+                "mounts": [
+                    full.to_dict(),
+                    {"name": "partial", "mount_type": "LOCAL", "share_path": "/data"},
+                    dict(_nfs("extra").to_dict(), added_later=True),
+                ],
+            }
+        )
+        collection = NetworkMountManager.parse_collection(content)
+        self.assertEqual(2, collection.version)
+        self.assertEqual(full, collection.mounts[0])
+        partial = collection.mounts[1]
+        self.assertEqual(
+            ("local", "/data", True, None, ""),
+            (partial.mount_type, partial.share_path, partial.enabled, partial.password, partial.mount_options),
+        )
+        self.assertEqual("extra", collection.mounts[2].name)
+        self.assertIs(collection.mounts[0], collection.get_mount_by_id(full.id))
+
+        with self.assertRaises(PersistError):
+            NetworkMountManager.parse_collection(json.dumps({"mounts": [{"mount_type": "nfs"}]}))
+        with self.assertRaises(PersistError):
+            NetworkMountManager.parse_collection("{not json")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
 # Copyright 2024, RapidCopy Contributors, All rights reserved.
 
+import json
+import os
 import unittest
 import tempfile
+from dataclasses import asdict
 from unittest.mock import patch
 
 from common.path_pair import (
@@ -17,6 +20,11 @@ from common.path_pair import (
 class TestIsRunningInDocker(unittest.TestCase):
     """Tests for Docker environment detection."""
 
+    def setUp(self):
+        # The detection result is cached per process
+        is_running_in_docker.cache_clear()
+        self.addCleanup(is_running_in_docker.cache_clear)
+
     @patch("os.path.exists")
     def test_detects_docker_via_dockerenv(self, mock_exists):
         """Should return True when /.dockerenv exists."""
@@ -170,6 +178,161 @@ class TestPathPairCollection(unittest.TestCase):
         warnings = collection.update_pair(updated_pair)
         self.assertEqual(len(warnings), 1)
 
+    @patch("common.path_pair.is_running_in_docker", return_value=False)
+    def test_lookup_by_id_follows_mutations(self, mock_docker):
+        """get_pair_by_id should reflect adds, updates, removes and loaded pairs."""
+        first = PathPair(name="One", remote_path="/remote/one", local_path="/local/one")
+        collection = PathPairCollection(path_pairs=[first])
+        self.assertIs(first, collection.get_pair_by_id(first.id))
+
+        second = PathPair(name="Two", remote_path="/remote/two", local_path="/local/two")
+        collection.add_pair(second)
+        with self.assertRaises(PathPairError):
+            collection.add_pair(PathPair(id=second.id, remote_path="/remote/x", local_path="/local/x"))
+
+        replacement = PathPair(id=first.id, name="One", remote_path="/remote/new", local_path="/local/one")
+        collection.update_pair(replacement)
+        self.assertIs(replacement, collection.get_pair_by_id(first.id))
+        self.assertEqual([replacement, second], collection.path_pairs)
+
+        collection.remove_pair(first.id)
+        self.assertIsNone(collection.get_pair_by_id(first.id))
+        self.assertEqual([second], collection.path_pairs)
+        with self.assertRaises(PathPairError):
+            collection.remove_pair(first.id)
+
+    @patch("common.path_pair.is_running_in_docker", return_value=False)
+    def test_reorder_pairs(self, mock_docker):
+        """reorder_pairs should accept a permutation and reject anything else."""
+        one = PathPair(name="One", remote_path="/remote/one", local_path="/local/one")
+        two = PathPair(name="Two", remote_path="/remote/two", local_path="/local/two")
+        collection = PathPairCollection(path_pairs=[one, two])
+
+        collection.reorder_pairs([two.id, one.id])
+        self.assertEqual([two, one], collection.path_pairs)
+
+        for bad_order in ([one.id], [one.id, two.id, one.id], [one.id, "missing"]):
+            with self.assertRaises(PathPairError):
+                collection.reorder_pairs(bad_order)
+        self.assertEqual([two, one], collection.path_pairs)
+
+
+class TestPathPairManager(unittest.TestCase):
+    """Tests for PathPairManager accessors."""
+
+    @patch("common.path_pair.is_running_in_docker", return_value=False)
+    def test_get_all_pairs_returns_copy(self, mock_docker):
+        """Changing the returned list should not touch the collection or its id index."""
+        with tempfile.TemporaryDirectory() as config_dir:
+            manager = PathPairManager(config_dir)
+            manager.load()
+            pair = PathPair(name="One", remote_path="/remote/one", local_path="/local/one")
+            manager.add_pair(pair)
+
+            pairs = manager.get_all_pairs()
+            pairs.clear()
+            self.assertEqual([pair], manager.get_all_pairs())
+            self.assertIs(pair, manager.get_pair_by_id(pair.id))
+
+
+class TestPathPairManagerSerialization(unittest.TestCase):
+    """Tests for PathPairManager persistence round trips."""
+
+    def test_to_dict_matches_asdict(self):
+        """to_dict should produce the same fields as dataclasses.asdict."""
+        pair = PathPair(name="Movies", remote_path="/remote/movies", local_path="/downloads/movies", enabled=False)
+        self.assertEqual(asdict(pair), pair.to_dict())
+
+    @patch("common.path_pair.is_running_in_docker", return_value=False)
+    def test_save_and_load_round_trip(self, mock_docker):
+        """Saved path pairs should load back unchanged."""
+        with tempfile.TemporaryDirectory() as config_dir:
+            manager = PathPairManager(config_dir)
+            manager.load()
+            pair = PathPair(name="Movies", remote_path="/remote/movies", local_path="/downloads/movies")
+            manager.add_pair(pair)
+
+            loaded = PathPairManager(config_dir).load()
+            self.assertEqual([pair], loaded.path_pairs)
+
+    @patch("common.path_pair.is_running_in_docker", return_value=False)
+    def test_batch_saves_once(self, mock_docker):
+        """Mutations inside batch() should be written in a single save."""
+        with tempfile.TemporaryDirectory() as config_dir:
+            manager = PathPairManager(config_dir)
+            manager.load()
+            one = PathPair(name="One", remote_path="/remote/one", local_path="/local/one")
+            two = PathPair(name="Two", remote_path="/remote/two", local_path="/local/two")
+            with patch.object(manager, "save", wraps=manager.save) as mock_save:
+                with manager.batch():
+                    manager.add_pairs([one, two])
+                    manager.remove_pair(one.id)
+                    self.assertEqual(0, mock_save.call_count)
+                self.assertEqual(1, mock_save.call_count)
+
+            self.assertEqual([two], PathPairManager(config_dir).load().path_pairs)
+
+    @patch("common.path_pair.is_running_in_docker", return_value=False)
+    def test_batch_does_not_save_when_body_raises(self, mock_docker):
+        """A batch that raises should not persist its partial changes or hide the error."""
+        with tempfile.TemporaryDirectory() as config_dir:
+            manager = PathPairManager(config_dir)
+            manager.load()
+            one = PathPair(name="One", remote_path="/remote/one", local_path="/local/one")
+            with patch.object(manager, "save", wraps=manager.save) as mock_save:
+                with self.assertRaises(RuntimeError):
+                    with manager.batch():
+                        manager.add_pair(one)
+                        raise RuntimeError("boom")
+                self.assertEqual(0, mock_save.call_count)
+            self.assertFalse(os.path.exists(manager.file_path))
+
+    @patch("common.path_pair.is_running_in_docker", return_value=False)
+    def test_add_pairs_is_all_or_nothing(self, mock_docker):
+        """add_pairs should add and save nothing if any pair is rejected."""
+        with tempfile.TemporaryDirectory() as config_dir:
+            manager = PathPairManager(config_dir)
+            manager.load()
+            existing = PathPair(name="Existing", remote_path="/remote/e", local_path="/local/e")
+            manager.add_pair(existing)
+            one = PathPair(name="One", remote_path="/remote/one", local_path="/local/one")
+            duplicate = PathPair(id=existing.id, remote_path="/remote/d", local_path="/local/d")
+            with patch.object(manager, "save", wraps=manager.save) as mock_save:
+                with self.assertRaises(PathPairError):
+                    manager.add_pairs([one, duplicate])
+                self.assertEqual(0, mock_save.call_count)
+            self.assertEqual([existing], manager.get_all_pairs())
+            self.assertIsNone(manager.get_pair_by_id(one.id))
+            self.assertEqual([existing], PathPairManager(config_dir).load().path_pairs)
+
+    @patch("common.path_pair.is_running_in_docker", return_value=False)
+    def test_unchanged_save_is_skipped(self, mock_docker):
+        """Saving unchanged content should neither back up nor rewrite the file."""
+        with tempfile.TemporaryDirectory() as config_dir:
+            manager = PathPairManager(config_dir)
+            manager.load()
+            pair = PathPair(name="One", remote_path="/remote/one", local_path="/local/one")
+            manager.add_pair(pair)
+            backup_dir = os.path.join(config_dir, "backups")
+
+            manager.save()
+            self.assertFalse(os.path.exists(backup_dir))
+
+            pair.enabled = False
+            manager.save()
+            self.assertEqual(1, len(os.listdir(backup_dir)))
+            self.assertFalse(PathPairManager(config_dir).load().path_pairs[0].enabled)
+
+    @patch("common.path_pair.is_running_in_docker", return_value=False)
+    def test_to_str_is_indented_json(self, mock_docker):
+        """to_str should keep the json.dumps(indent=2) layout."""
+        with tempfile.TemporaryDirectory() as config_dir:
+            manager = PathPairManager(config_dir)
+            manager.load()
+            manager.add_pair(PathPair(name="TV", remote_path="/remote/tv", local_path="/tv"))
+            content = manager.to_str()
+            self.assertEqual(json.dumps(json.loads(content), indent=2), content)
+
 
 if __name__ == "__main__":
     unittest.main()
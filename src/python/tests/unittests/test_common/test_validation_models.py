@@ -0,0 +1,168 @@
+# Copyright 2024, RapidCopy Contributors, All rights reserved.
+
+import dataclasses
+import pickle
+import unittest
+
+from common import ChunkInfo, ChunkStatus, FileValidationInfo, NetworkStats
+
+
+class TestChunkInfo(unittest.TestCase):
+    def test_status_read_only(self):
+        chunk = ChunkInfo(index=0, offset=0, size=10)
+        self.assertEqual(ChunkStatus.PENDING, chunk.status)
+        with self.assertRaises(AttributeError):
+            chunk.status = ChunkStatus.VALID
+
+    def test_mark_downloading_counts_retries(self):
+        chunk = ChunkInfo(index=0, offset=0, size=10)
+        chunk.mark_downloading()
+        chunk.mark_downloading()
+        self.assertEqual(ChunkStatus.DOWNLOADING, chunk.status)
+        self.assertEqual(2, chunk.retry_count)
+
+
+class TestFileValidationInfo(unittest.TestCase):
+    def test_status_transitions_update_counts(self):
+        info = FileValidationInfo.from_layout("file", 40, 10)
+        chunk = info.chunks[1]
+
+        chunk.mark_valid()
+        self.assertEqual((1, 1, []), (info.valid_chunks, info.validated_chunks, info.corrupt_chunk_indices))
+        chunk.mark_downloading()
+        self.assertEqual((0, 0, []), (info.valid_chunks, info.validated_chunks, info.corrupt_chunk_indices))
+        chunk.mark_pending()
+        self.assertEqual((0, 0, []), (info.valid_chunks, info.validated_chunks, info.corrupt_chunk_indices))
+        chunk.mark_corrupt()
+        self.assertEqual((0, 1, [1]), (info.valid_chunks, info.validated_chunks, info.corrupt_chunk_indices))
+        self.assertEqual([chunk], info.corrupt_chunks)
+        self.assertEqual(0.25, info.progress)
+
+    def test_repeated_mark_counted_once(self):
+        info = FileValidationInfo.from_layout("file", 20, 10)
+        info.chunks[0].mark_valid()
+        info.chunks[0].mark_valid()
+        info.chunks[1].mark_corrupt()
+        info.chunks[1].mark_corrupt()
+        self.assertEqual(1, info.valid_chunks)
+        self.assertEqual(2, info.validated_chunks)
+
+    def test_counts_seeded_from_existing_statuses(self):
+        chunks = [ChunkInfo(index=i, offset=i * 10, size=10) for i in range(4)]
+        chunks[0].mark_valid()
+        chunks[2].mark_corrupt()
+        chunks[3].mark_valid()
+        info = FileValidationInfo(file_path="file", file_size=40, chunks=chunks)
+        self.assertEqual(2, info.valid_chunks)
+        self.assertEqual(3, info.validated_chunks)
+        self.assertEqual([2], info.corrupt_chunk_indices)
+        # Later transitions are counted too
+        chunks[0].mark_corrupt()
+        self.assertEqual(1, info.valid_chunks)
+        self.assertEqual([0, 2], info.corrupt_chunk_indices)
+
+    def test_corrupt_chunk_indices_sorted(self):
+        info = FileValidationInfo.from_layout("file", 50, 10)
+        for index in (4, 0, 3):
+            info.chunks[index].mark_corrupt()
+        self.assertEqual([0, 3, 4], info.corrupt_chunk_indices)
+        self.assertEqual([0, 3, 4], [c.index for c in info.corrupt_chunks])
+
+    def test_chunks_fixed(self):
+        info = FileValidationInfo.from_layout("file", 20, 10)
+        self.assertIsInstance(info.chunks, tuple)
+        with self.assertRaises(AttributeError):
+            info.chunks = []
+        with self.assertRaises(AttributeError):
+            info.chunks.append(ChunkInfo(index=2, offset=20, size=10))
+
+    def test_chunk_belongs_to_one_info(self):
+        info = FileValidationInfo.from_layout("file", 20, 10)
+        with self.assertRaises(ValueError):
+            FileValidationInfo(file_path="other", file_size=20, chunks=list(info.chunks))
+
+    def test_asdict_and_pickle(self):
+        info = FileValidationInfo.from_layout("file", 20, 10)
+        info.chunks[1].mark_corrupt()
+        self.assertEqual(2, len(dataclasses.asdict(info)["chunks"]))
+        copy = pickle.loads(pickle.dumps(info))
+        self.assertEqual([1], copy.corrupt_chunk_indices)
+        copy.chunks[1].mark_valid()
+        self.assertEqual(1, copy.valid_chunks)
+        self.assertEqual(0, info.valid_chunks)
+
+    def test_from_layout_empty_file(self):
+        info = FileValidationInfo.from_layout("file", 0, 10)
+        self.assertEqual((), info.chunks)
+        self.assertEqual(0.0, info.progress)
+
+    def test_from_layout_exact_multiple(self):
+        info = FileValidationInfo.from_layout("file", 30, 10)
+        self.assertEqual([(0, 10), (10, 10), (20, 10)], [(c.offset, c.size) for c in info.chunks])
+        self.assertEqual([0, 1, 2], [c.index for c in info.chunks])
+
+    def test_from_layout_remainder(self):
+        info = FileValidationInfo.from_layout("file", 25, 10)
+        self.assertEqual([(0, 10), (10, 10), (20, 5)], [(c.offset, c.size) for c in info.chunks])
+        self.assertEqual(25, info.chunks[-1].end_offset)
+
+    def test_from_layout_smaller_than_chunk(self):
+        info = FileValidationInfo.from_layout("file", 7, 10)
+        self.assertEqual([(0, 7)], [(c.offset, c.size) for c in info.chunks])
+
+
+class TestNetworkStats(unittest.TestCase):
+    def test_first_speed_sample_seeds_average(self):
+        stats = NetworkStats()
+        stats.record_speed(1000.0)
+        self.assertEqual(1000.0, stats.avg_speed_bytes_per_sec)
+
+    def test_speed_moves_by_alpha_of_the_difference(self):
+        stats = NetworkStats()
+        stats.record_speed(1000.0)
+        stats.record_speed(2000.0)
+        self.assertAlmostEqual(1000.0 + NetworkStats.ALPHA * 1000.0, stats.avg_speed_bytes_per_sec)
+
+    def test_old_speed_samples_decay(self):
+        stats = NetworkStats()
+        stats.record_speed(1000.0)
+        for _ in range(60):
+            stats.record_speed(100.0)
+        # The first sample's weight has decayed by (1 - ALPHA) ** 60
+        expected = 100.0 + 900.0 * (1 - NetworkStats.ALPHA) ** 60
+        self.assertAlmostEqual(expected, stats.avg_speed_bytes_per_sec)
+        self.assertLess(stats.avg_speed_bytes_per_sec, 101.0)
+
+    def test_failure_rate_update_and_decay(self):
+        stats = NetworkStats()
+        stats.record_chunk_result(False)
+        self.assertAlmostEqual(NetworkStats.ALPHA, stats.recent_failure_rate)
+        stats.record_chunk_result(False)
+        self.assertAlmostEqual(1 - (1 - NetworkStats.ALPHA) ** 2, stats.recent_failure_rate)
+
+        rate = stats.recent_failure_rate
+        for _ in range(10):
+            stats.record_chunk_result(True)
+        self.assertAlmostEqual(rate * (1 - NetworkStats.ALPHA) ** 10, stats.recent_failure_rate)
+        self.assertEqual((2, 10), (stats.recent_chunk_failures, stats.recent_chunk_successes))
+
+    def test_failure_rate_stays_in_range(self):
+        stats = NetworkStats()
+        for _ in range(200):
+            stats.record_chunk_result(False)
+        self.assertLessEqual(stats.recent_failure_rate, 1.0)
+        self.assertGreater(stats.recent_failure_rate, 0.99)
+        for _ in range(200):
+            stats.record_chunk_result(True)
+        self.assertGreaterEqual(stats.recent_failure_rate, 0.0)
+        self.assertLess(stats.recent_failure_rate, 0.01)
+
+    def test_reset_window_clears_failure_history(self):
+        stats = NetworkStats()
+        stats.record_speed(1000.0)
+        stats.record_chunk_result(False)
+        stats.reset_window()
+        self.assertEqual(
+            (0.0, 0, 0), (stats.recent_failure_rate, stats.recent_chunk_failures, stats.recent_chunk_successes)
+        )
+        self.assertEqual(1000.0, stats.avg_speed_bytes_per_sec)
@@ -0,0 +1,194 @@
+# Copyright 2024, RapidCopy Contributors, All rights reserved.
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from common import ChunkInfo, ValidationAlgorithm
+from controller.validate import checksum
+from controller.validate.checksum import LocalChecksumGenerator, RemoteChecksumGenerator, ChecksumError
+
+
+def _chunks(file_size: int, chunk_size: int) -> list[ChunkInfo]:
+    return [
+        ChunkInfo(index=i, offset=offset, size=min(chunk_size, file_size - offset))
+        for i, offset in enumerate(range(0, file_size, chunk_size))
+    ]
+
+
+class TestLocalChecksumGenerator(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="test_checksum")
+        self.data = os.urandom(10 * 4096 + 123)
+        self.file_path = os.path.join(self.temp_dir, "file")
+        with open(self.file_path, "wb") as f:
+            f.write(self.data)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _expected(self, chunks: list[ChunkInfo]) -> list[str]:
+        return [hashlib.sha256(self.data[c.offset : c.end_offset]).hexdigest() for c in chunks]
+
+    def test_chunk_checksums_in_order_with_workers(self):
+        chunks = _chunks(len(self.data), 4096)
+        generator = LocalChecksumGenerator(ValidationAlgorithm.SHA256, buffer_size=1000, workers=4)
+        try:
+            self.assertEqual(self._expected(chunks), generator.compute_chunk_checksums(self.file_path, chunks))
+        finally:
+            generator.close()
+
+    def test_chunk_checksums_match_single_chunk_checksum(self):
+        chunks = _chunks(len(self.data), 4096)
+        generator = LocalChecksumGenerator(ValidationAlgorithm.SHA256, workers=3)
+        try:
+            batch = generator.compute_chunk_checksums(self.file_path, chunks)
+        finally:
+            generator.close()
+        single = [generator.compute_chunk_checksum(self.file_path, c.offset, c.size) for c in chunks]
+        self.assertEqual(single, batch)
+
+    def test_chunk_checksums_empty(self):
+        generator = LocalChecksumGenerator(workers=4)
+        self.assertEqual([], generator.compute_chunk_checksums(self.file_path, []))
+        self.assertIsNone(generator._pool)
+
+    def test_chunk_checksums_missing_file(self):
+        generator = LocalChecksumGenerator(workers=4)
+        with self.assertRaises(ChecksumError):
+            generator.compute_chunk_checksums(os.path.join(self.temp_dir, "missing"), _chunks(8192, 4096))
+
+    def test_chunk_checksums_directory(self):
+        generator = LocalChecksumGenerator(workers=4)
+        with self.assertRaises(ChecksumError):
+            generator.compute_chunk_checksums(self.temp_dir, _chunks(8192, 4096))
+
+    def test_chunk_checksums_read_error_in_worker(self):
+        generator = LocalChecksumGenerator(ValidationAlgorithm.SHA256, workers=4)
+        real_pread = os.pread
+
+        def failing_pread(fd, n, offset):
+            if offset >= 8192:
+                raise OSError(5, "Input/output error")
+            return real_pread(fd, n, offset)
+
+        try:
+            with patch("controller.validate.checksum.os.pread", side_effect=failing_pread):
+                with self.assertRaises(ChecksumError):
+                    generator.compute_chunk_checksums(self.file_path, _chunks(len(self.data), 4096))
+        finally:
+            generator.close()
+
+    def test_chunk_checksums_error_waits_for_other_workers(self):
+        generator = LocalChecksumGenerator(ValidationAlgorithm.SHA256, workers=2)
+        real_pread = os.pread
+        real_close = os.close
+        slow_read_started = threading.Event()
+        reads_in_flight = []
+        in_flight_at_close = []
+
+        def pread(fd, n, offset):
+            if offset == 0:
+                # Fail the first chunk only once the second is mid-read
+                slow_read_started.wait(timeout=5)
+                raise OSError(5, "Input/output error")
+            reads_in_flight.append(offset)
+            slow_read_started.set()
+            time.sleep(0.2)
+            data = real_pread(fd, n, offset)
+            reads_in_flight.remove(offset)
+            return data
+
+        def close(fd):
+            in_flight_at_close.append(list(reads_in_flight))
+            real_close(fd)
+
+        try:
+            with patch("controller.validate.checksum.os.pread", side_effect=pread), patch(
+                "controller.validate.checksum.os.close", side_effect=close
+            ):
+                with self.assertRaises(ChecksumError):
+                    generator.compute_chunk_checksums(self.file_path, _chunks(8192, 4096))
+        finally:
+            generator.close()
+        self.assertEqual([[]], in_flight_at_close)
+
+    def test_close_shuts_down_pool(self):
+        chunks = _chunks(len(self.data), 4096)
+        generator = LocalChecksumGenerator(ValidationAlgorithm.SHA256, workers=2)
+        generator.compute_chunk_checksums(self.file_path, chunks)
+        pool = generator._pool
+        self.assertIsNotNone(pool)
+        generator.close()
+        self.assertIsNone(generator._pool)
+        with self.assertRaises(RuntimeError):
+            pool.submit(print)
+        # Closing twice is harmless, and the generator can still be used afterwards
+        generator.close()
+        self.assertEqual(self._expected(chunks), generator.compute_chunk_checksums(self.file_path, chunks))
+        generator.close()
+
+    def test_single_worker_uses_no_pool(self):
+        generator = LocalChecksumGenerator(workers=0)
+        self.assertEqual(1, generator.workers)
+        generator.compute_chunk_checksums(self.file_path, _chunks(len(self.data), 4096))
+        self.assertIsNone(generator._pool)
+
+
+class TestBlake3(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="test_checksum")
+        self.data = os.urandom(3 * 4096)
+        self.file_path = os.path.join(self.temp_dir, "file")
+        with open(self.file_path, "wb") as f:
+            f.write(self.data)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_algorithm_value(self):
+        self.assertIs(ValidationAlgorithm.BLAKE3, ValidationAlgorithm("blake3"))
+
+    def test_remote_command(self):
+        generator = RemoteChecksumGenerator(MagicMock(), algorithm=ValidationAlgorithm.BLAKE3)
+        self.assertEqual("b3sum", generator._get_checksum_command())
+
+    def test_missing_package(self):
+        generator = LocalChecksumGenerator(ValidationAlgorithm.BLAKE3)
+        with patch.object(checksum, "blake3", None):
+            with self.assertRaises(ChecksumError):
+                generator.compute_chunk_checksum(self.file_path, 0, 4096)
+            with self.assertRaises(ChecksumError):
+                generator.compute_file_checksum(self.file_path)
+
+    def test_threads_only_for_whole_file(self):
+        fake_blake3 = MagicMock()
+        fake_blake3.blake3.return_value.hexdigest.return_value = "abc"
+        generator = LocalChecksumGenerator(ValidationAlgorithm.BLAKE3, workers=2)
+        self.addCleanup(generator.close)
+        with patch.object(checksum, "blake3", fake_blake3):
+            generator.compute_chunk_checksums(self.file_path, _chunks(len(self.data), 4096))
+            self.assertEqual(3, fake_blake3.blake3.call_count)
+            for args, kwargs in fake_blake3.blake3.call_args_list:
+                self.assertEqual(((), {}), (args, kwargs))
+            fake_blake3.blake3.reset_mock()
+            generator.compute_file_checksum(self.file_path)
+            fake_blake3.blake3.assert_called_once_with(max_threads=fake_blake3.blake3.AUTO)
+
+    @unittest.skipIf(checksum.blake3 is None, "blake3 not installed")
+    def test_chunk_and_file_checksums(self):
+        generator = LocalChecksumGenerator(ValidationAlgorithm.BLAKE3, workers=2)
+        self.addCleanup(generator.close)
+        chunks = _chunks(len(self.data), 4096)
+        self.assertEqual(
+            [checksum.blake3.blake3(self.data[c.offset : c.end_offset]).hexdigest() for c in chunks],
+            generator.compute_chunk_checksums(self.file_path, chunks),
+        )
+        self.assertEqual(
+            checksum.blake3.blake3(self.data).hexdigest(), generator.compute_file_checksum(self.file_path)
+        )
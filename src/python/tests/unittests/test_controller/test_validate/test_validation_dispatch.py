@@ -0,0 +1,107 @@
+# Copyright 2024, RapidCopy Contributors, All rights reserved.
+
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from common import ChunkStatus, ValidationAlgorithm, ValidationConfig
+from controller.validate.checksum import ChecksumError
+from controller.validate.validation_process import ValidationDispatch, ValidationCommand
+from model import ModelFile
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class TestValidationDispatchBatching(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="test_validation_dispatch")
+        self.data = os.urandom(5 * _CHUNK_SIZE + 17)
+        with open(os.path.join(self.temp_dir, "file"), "wb") as f:
+            f.write(self.data)
+        self.local_path = os.path.join(self.temp_dir, "file")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _make_dispatch(self, workers: int, max_chunk_size: int = 100 * _CHUNK_SIZE) -> ValidationDispatch:
+        config = ValidationConfig(
+            algorithm=ValidationAlgorithm.SHA256,
+            default_chunk_size=_CHUNK_SIZE,
+            min_chunk_size=_CHUNK_SIZE,
+            max_chunk_size=max_chunk_size,
+            enable_adaptive_sizing=False,
+            parallel_validation=workers,
+            settle_delay_secs=0,
+        )
+        dispatch = ValidationDispatch(
+            config=config, sshcp=MagicMock(), local_base_path=self.temp_dir, remote_base_path="/remote"
+        )
+        self.addCleanup(dispatch.close)
+        # The remote holds the same bytes as the local file
+        dispatch._remote_checksum = MagicMock()
+        dispatch._remote_checksum.compute_chunk_checksums.side_effect = lambda _path, chunks: [
+            hashlib.sha256(self.data[c.offset : c.end_offset]).hexdigest() for c in chunks
+        ]
+        return dispatch
+
+    def _start(self, dispatch: ValidationDispatch):
+        f = ModelFile("file", False)
+        f.remote_size = len(self.data)
+        dispatch.queue_validation(
+            ValidationCommand(file=f, local_path="file", remote_path="file", file_size=len(self.data))
+        )
+
+    def _statuses(self, dispatch: ValidationDispatch) -> list[ChunkStatus]:
+        info = dispatch._chunk_manager.get_validation_info(self.local_path)
+        return [c.status for c in info.chunks]
+
+    def test_workers_from_config(self):
+        self.assertEqual(3, self._make_dispatch(workers=3)._local_checksum.workers)
+        self.assertEqual(os.cpu_count() or 1, self._make_dispatch(workers=0)._local_checksum.workers)
+
+    def test_tick_hashes_one_chunk_per_worker(self):
+        dispatch = self._make_dispatch(workers=2)
+        self._start(dispatch)
+        self.assertIsNone(dispatch.process_next())
+        self.assertEqual([ChunkStatus.VALID] * 2 + [ChunkStatus.PENDING] * 4, self._statuses(dispatch))
+
+    def test_tick_not_limited_by_max_chunk_size_bytes(self):
+        dispatch = self._make_dispatch(workers=5, max_chunk_size=_CHUNK_SIZE)
+        self._start(dispatch)
+        self.assertIsNone(dispatch.process_next())
+        self.assertEqual([ChunkStatus.VALID] * 5 + [ChunkStatus.PENDING], self._statuses(dispatch))
+
+    def test_all_chunks_valid(self):
+        dispatch = self._make_dispatch(workers=4)
+        self._start(dispatch)
+        result = None
+        for _ in range(10):
+            result = dispatch.process_next()
+            if result is not None:
+                break
+        self.assertIsNotNone(result)
+        self.assertTrue(result.is_valid)
+        self.assertEqual([], result.corrupt_chunks)
+
+    def test_batch_error_retries_chunks_individually(self):
+        dispatch = self._make_dispatch(workers=3)
+        local_checksum = dispatch._local_checksum
+        real_chunk_checksum = local_checksum.compute_chunk_checksum
+
+        def chunk_checksum(path, offset, size):
+            if offset == _CHUNK_SIZE:
+                raise ChecksumError("unreadable")
+            return real_chunk_checksum(path, offset, size)
+
+        local_checksum.compute_chunk_checksums = MagicMock(side_effect=ChecksumError("batch failed"))
+        local_checksum.compute_chunk_checksum = MagicMock(side_effect=chunk_checksum)
+        self._start(dispatch)
+        self.assertIsNone(dispatch.process_next())
+        self.assertEqual(3, local_checksum.compute_chunk_checksum.call_count)
+        self.assertEqual(
+            [ChunkStatus.VALID, ChunkStatus.CORRUPT, ChunkStatus.VALID] + [ChunkStatus.PENDING] * 3,
+            self._statuses(dispatch),
+        )
@@ -46,7 +46,9 @@ class TestValidationSettleDelay(unittest.TestCase):
         # Stub out checksum generators so validation short-circuits without real I/O
         dispatch._local_checksum = MagicMock()
         dispatch._remote_checksum = MagicMock()
+        dispatch._local_checksum.workers = 1
         dispatch._local_checksum.compute_chunk_checksum.return_value = "abc123"
+        dispatch._local_checksum.compute_chunk_checksums.return_value = ["abc123"]
         dispatch._local_checksum.compute_file_checksum.return_value = "abc123"
         dispatch._remote_checksum.compute_chunk_checksums.return_value = ["abc123"]
         dispatch._remote_checksum.compute_file_checksum.return_value = "abc123"
@@ -29,6 +29,7 @@ from common.mount_utils import (
     do_mount,
     do_unmount,
     get_mount_status,
+    get_mount_statuses,
     test_connection,
     encrypt_password,
     MountResult,
@@ -62,9 +63,8 @@ class MountsHandler(IHandler):
         mounts = self._manager.get_all_mounts()
 
         result = []
-        for mount in mounts:
+        for mount, (status, status_message) in zip(mounts, get_mount_statuses(mounts)):
             mount_data = mount.to_dict_safe()
-            status, status_message = get_mount_status(mount)
             mount_data["status"] = status.value
             mount_data["status_message"] = status_message
             result.append(mount_data)
@@ -1,7 +1,6 @@
 # Copyright 2017, Inderpreet Singh, All rights reserved.
 
 import json
-import collections
 
 from common import Config
 
@@ -12,9 +11,6 @@ class SerializeConfig:
         config_dict = config.as_dict()
 
         # Make the section names lower case
-        keys = list(config_dict.keys())
-        config_dict_lowercase = collections.OrderedDict()
-        for key in keys:
-            config_dict_lowercase[key.lower()] = config_dict[key]
+        config_dict_lowercase = {key.lower(): value for key, value in config_dict.items()}
 
         return json.dumps(config_dict_lowercase)